@@ -2,5 +2,5 @@ from .envelope import Envelope
 from .operator import Operator
 from .algorithm import ALGORITHMS, apply_algorithm
 from .lfo import LFO
-from .voice import Voice
+from .voice import Voice, VoicePatch
 from .synth import Synth
@@ -15,6 +15,7 @@ Parameters:
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from enum import IntEnum
 from typing import Optional
 
@@ -59,6 +60,21 @@ def _delay_to_seconds(delay: int) -> float:
     return delay * delay * 0.0005  # quadratic curve, max ~ 4.9 s
 
 
+# ---------------------------------------------------------------------------
+# LFO data container
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class LFOParams:
+    """LFO settings of a preset (see :class:`LFO` for their meaning)."""
+    waveform: int = LFOWaveform.TRIANGLE
+    speed: int = 35
+    delay: int = 0
+    pmd: int = 0
+    amd: int = 0
+    key_sync: bool = True
+
+
 # ---------------------------------------------------------------------------
 # LFO class
 # ---------------------------------------------------------------------------
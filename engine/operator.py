@@ -124,7 +124,7 @@ def velocity_scale(velocity: int, sensitivity: int) -> float:
 # Keyboard Level Scaling
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class KeyboardLevelScaling:
     """DX7 keyboard level scaling parameters for one operator.
 
@@ -221,7 +221,7 @@ def key_rate_scaling(rate: int, note: int, krs: int) -> int:
 # Operator data container
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class OperatorParams:
     """All parameters for a single DX7 operator."""
     # Oscillator
@@ -7,11 +7,12 @@ loading, and audio mixing.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Callable, Mapping
 
 import numpy as np
 
-from .voice import Voice
+from .voice import Voice, VoicePatch
 
 
 # ---------------------------------------------------------------------------
@@ -53,27 +54,38 @@ class Synth:
         # Map from MIDI note -> voice index (for note-off lookup).
         self._note_to_voice: dict[int, int] = {}
 
-        # Current preset (kept so new voices can be initialised).
-        self._current_preset: Optional[dict[str, Any]] = None
-
         # Master volume (linear, 0.0 - 1.0).
         self.master_volume: float = 0.8
 
+        # Engine events queued by other threads as (method, args) pairs and
+        # applied in arrival order at the start of render(), so notes,
+        # presets and controller changes can never overtake each other and
+        # only the audio thread ever touches the voices.
+        # deque.append/popleft are atomic, so no lock is needed.  The
+        # deque has no maxlen, since dropping an event could lose a
+        # note-off; it is only used while render() drains it (see
+        # :attr:`realtime`), so it cannot grow without bound.
+        self._events: deque[tuple[Callable[..., None], tuple]] = deque()
+        self._realtime: bool = False
+
     # ------------------------------------------------------------------
     # Preset management
     # ------------------------------------------------------------------
 
-    def load_preset(self, preset: dict[str, Any]) -> None:
+    def load_preset(self, preset: Mapping[str, Any]) -> None:
         """Load a preset/patch into all voices.
 
         Parameters
         ----------
-        preset : dict
+        preset : mapping
             DX7 preset dictionary (see Voice.load_preset for format).
         """
-        self._current_preset = preset
+        self.load_patch(VoicePatch.from_preset(preset))
+
+    def load_patch(self, patch: VoicePatch) -> None:
+        """Load an already parsed preset into all voices."""
         for voice in self.voices:
-            voice.load_preset(preset)
+            voice.load_patch(patch)
 
     # ------------------------------------------------------------------
     # Real-time controllers
@@ -142,14 +154,14 @@ class Synth:
             if self._note_to_voice[old_note] == voice_idx:
                 del self._note_to_voice[old_note]
 
-        # Assign and trigger.
+        # Assign and trigger.  Every voice already holds the current patch
+        # (load_patch/set_algorithm update all of them), and gate_on resets
+        # the operator phases, envelopes and feedback in place.  The LFO is
+        # restarted explicitly because its gate_on only resets the phase
+        # with key sync on, and each note has always started a fresh LFO.
         self._note_to_voice[note] = voice_idx
         voice = self.voices[voice_idx]
-
-        # Reload preset if one is set (ensures fresh operator state).
-        if self._current_preset is not None:
-            voice.load_preset(self._current_preset)
-
+        voice.lfo.reset()
         voice.gate_on(note, velocity)
 
     def note_off(self, note: int) -> None:
@@ -166,6 +178,75 @@ class Synth:
         voice_idx = self._note_to_voice.pop(note)
         self.voices[voice_idx].gate_off()
 
+    # ------------------------------------------------------------------
+    # Queued events
+    # ------------------------------------------------------------------
+    # While realtime is set, the queue_* methods are safe to call from any
+    # thread; they return without touching voice state and the events are
+    # applied, in the order they were queued, by the next render() call.
+    # Otherwise nothing would drain the queue, so they apply at once.
+
+    @property
+    def realtime(self) -> bool:
+        """True while an audio stream calls :meth:`render`."""
+        return self._realtime
+
+    @realtime.setter
+    def realtime(self, enabled: bool) -> None:
+        self._realtime = enabled
+        if not enabled:
+            self.drain_events()
+
+    def _post(self, func: Callable[..., None], *args: Any) -> None:
+        """Queue ``func(*args)``, or call it now when not realtime."""
+        if self._realtime:
+            self._events.append((func, args))
+        else:
+            func(*args)
+
+    def queue_note_on(self, note: int, velocity: int) -> None:
+        """Queue :meth:`note_on`."""
+        self._post(self.note_on, note, velocity)
+
+    def queue_note_off(self, note: int) -> None:
+        """Queue :meth:`note_off`."""
+        self._post(self.note_off, note)
+
+    def queue_load_preset(self, preset: Mapping[str, Any]) -> None:
+        """Queue :meth:`load_preset`.
+
+        The preset is parsed here, on the calling thread, so the audio
+        thread only has to load the finished patch.
+        """
+        self.queue_load_patch(VoicePatch.from_preset(preset))
+
+    def queue_load_patch(self, patch: VoicePatch) -> None:
+        """Queue :meth:`load_patch`."""
+        self._post(self.load_patch, patch)
+
+    def queue_set_algorithm(self, algorithm: int) -> None:
+        """Queue :meth:`set_algorithm`."""
+        self._post(self.set_algorithm, algorithm)
+
+    def queue_pitch_bend(self, value: float) -> None:
+        """Queue :meth:`set_pitch_bend`."""
+        self._post(self.set_pitch_bend, value)
+
+    def queue_mod_wheel(self, value: float) -> None:
+        """Queue :meth:`set_mod_wheel`."""
+        self._post(self.set_mod_wheel, value)
+
+    def queue_set_operator_enabled(self, op_index: int, enabled: bool) -> None:
+        """Queue :meth:`set_operator_enabled`."""
+        self._post(self.set_operator_enabled, op_index, enabled)
+
+    def drain_events(self) -> None:
+        """Apply every queued event in arrival order."""
+        events = self._events
+        while events:
+            func, args = events.popleft()
+            func(*args)
+
     def all_notes_off(self) -> None:
         """Release all currently sounding notes."""
         for voice in self.voices:
@@ -174,6 +255,7 @@ class Synth:
 
     def panic(self) -> None:
         """Immediately silence all voices (hard reset)."""
+        self._events.clear()
         for voice in self.voices:
             voice.reset()
         self._note_to_voice.clear()
@@ -195,6 +277,8 @@ class Synth:
         np.ndarray
             Float64 array of shape (num_samples,) in range [-1.0, 1.0].
         """
+        self.drain_events()
+
         mix = np.zeros(num_samples, dtype=np.float64)
 
         for voice in self.voices:
@@ -9,14 +9,16 @@ the DX7 SysEx patch structure.
 
 from __future__ import annotations
 
+import functools
 import math
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
 
 import numpy as np
 
 from .operator import Operator, OperatorParams, KeyboardLevelScaling
 from .envelope import Envelope
-from .lfo import LFO, LFOWaveform
+from .lfo import LFO, LFOParams, LFOWaveform
 from .algorithm import ALGORITHMS, apply_algorithm
 
 
@@ -79,6 +81,93 @@ def _default_preset() -> dict[str, Any]:
     return preset
 
 
+# ---------------------------------------------------------------------------
+# Parsed presets
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class VoicePatch:
+    """A preset dictionary parsed once into engine parameter objects.
+
+    Every part of a patch is immutable and operators only read their
+    ``OperatorParams``, so a single patch can be loaded into every voice
+    without looking at the preset dictionary again.
+
+    Attributes
+    ----------
+    algorithm : int
+        Algorithm index (0-31).
+    feedback : int
+        Feedback level (0-7).
+    lfo : LFOParams
+        LFO settings.
+    operators : tuple of OperatorParams
+        Parameters of operators 1-6.
+    """
+
+    algorithm: int
+    feedback: int
+    lfo: LFOParams
+    operators: tuple[OperatorParams, ...]
+
+    @classmethod
+    def from_preset(cls, preset: Mapping[str, Any]) -> "VoicePatch":
+        """Parse a preset dictionary (see :meth:`Voice.load_preset`)."""
+        lfo_data = preset.get("lfo", {})
+        lfo = LFOParams(
+            waveform=lfo_data.get("waveform", 0),
+            speed=lfo_data.get("speed", 35),
+            delay=lfo_data.get("delay", 0),
+            pmd=lfo_data.get("pmd", 0),
+            amd=lfo_data.get("amd", 0),
+            key_sync=lfo_data.get("key_sync", True),
+        )
+
+        operators = []
+        for i in range(6):
+            op_data = preset.get(f"op{i + 1}", {})
+
+            kls = KeyboardLevelScaling(
+                breakpoint=op_data.get("kls_breakpoint", 60),
+                left_depth=op_data.get("kls_left_depth", 0),
+                right_depth=op_data.get("kls_right_depth", 0),
+                left_curve=op_data.get("kls_left_curve", 0),
+                right_curve=op_data.get("kls_right_curve", 0),
+            )
+
+            operators.append(OperatorParams(
+                osc_mode=op_data.get("osc_mode", 0),
+                coarse=op_data.get("coarse", 1),
+                fine=op_data.get("fine", 0),
+                detune=op_data.get("detune", 0),
+                output_level=op_data.get("output_level", 0),
+                rate1=op_data.get("rate1", 99),
+                rate2=op_data.get("rate2", 99),
+                rate3=op_data.get("rate3", 99),
+                rate4=op_data.get("rate4", 99),
+                level1=op_data.get("level1", 99),
+                level2=op_data.get("level2", 99),
+                level3=op_data.get("level3", 0),
+                level4=op_data.get("level4", 0),
+                velocity_sensitivity=op_data.get("velocity_sensitivity", 0),
+                key_rate_scaling=op_data.get("key_rate_scaling", 0),
+                kls=kls,
+            ))
+
+        return cls(
+            algorithm=int(preset.get("algorithm", 0)) % 32,
+            feedback=int(np.clip(preset.get("feedback", 0), 0, 7)),
+            lfo=lfo,
+            operators=tuple(operators),
+        )
+
+
+@functools.cache
+def _default_patch() -> VoicePatch:
+    """The parsed default preset, shared by every new voice."""
+    return VoicePatch.from_preset(_default_preset())
+
+
 # ---------------------------------------------------------------------------
 # Voice class
 # ---------------------------------------------------------------------------
@@ -125,13 +214,13 @@ class Voice:
         self._op_enabled: list[bool] = [True] * 6  # per-operator mute
 
         # Load default preset.
-        self.load_preset(_default_preset())
+        self.load_patch(_default_patch())
 
     # ------------------------------------------------------------------
     # Preset loading
     # ------------------------------------------------------------------
 
-    def load_preset(self, preset: dict[str, Any]) -> None:
+    def load_preset(self, preset: Mapping[str, Any]) -> None:
         """Load a preset/patch dictionary into this voice.
 
         The preset dict should contain keys:
@@ -140,53 +229,23 @@ class Voice:
             - ``lfo`` (dict with waveform, speed, delay, pmd, amd, key_sync)
             - ``op1`` .. ``op6`` (dicts with operator parameters)
         """
-        self.algorithm = int(preset.get("algorithm", 0)) % 32
-        self.feedback = int(np.clip(preset.get("feedback", 0), 0, 7))
+        self.load_patch(VoicePatch.from_preset(preset))
 
-        # LFO.
-        lfo_data = preset.get("lfo", {})
+    def load_patch(self, patch: VoicePatch) -> None:
+        """Load an already parsed preset into this voice.
+
+        Fresh LFO and operator objects are created (resetting their state);
+        the operator parameters are shared with *patch*.
+        """
+        self.algorithm = patch.algorithm
+        self.feedback = patch.feedback
+        lfo = patch.lfo
         self.lfo = LFO(
-            waveform=lfo_data.get("waveform", 0),
-            speed=lfo_data.get("speed", 35),
-            delay=lfo_data.get("delay", 0),
-            pmd=lfo_data.get("pmd", 0),
-            amd=lfo_data.get("amd", 0),
-            key_sync=lfo_data.get("key_sync", True),
+            waveform=lfo.waveform, speed=lfo.speed, delay=lfo.delay,
+            pmd=lfo.pmd, amd=lfo.amd, key_sync=lfo.key_sync,
             sample_rate=self.sample_rate,
         )
-
-        # Operators.
-        for i in range(6):
-            op_key = f"op{i + 1}"
-            op_data = preset.get(op_key, {})
-
-            kls = KeyboardLevelScaling(
-                breakpoint=op_data.get("kls_breakpoint", 60),
-                left_depth=op_data.get("kls_left_depth", 0),
-                right_depth=op_data.get("kls_right_depth", 0),
-                left_curve=op_data.get("kls_left_curve", 0),
-                right_curve=op_data.get("kls_right_curve", 0),
-            )
-
-            params = OperatorParams(
-                osc_mode=op_data.get("osc_mode", 0),
-                coarse=op_data.get("coarse", 1),
-                fine=op_data.get("fine", 0),
-                detune=op_data.get("detune", 0),
-                output_level=op_data.get("output_level", 0),
-                rate1=op_data.get("rate1", 99),
-                rate2=op_data.get("rate2", 99),
-                rate3=op_data.get("rate3", 99),
-                rate4=op_data.get("rate4", 99),
-                level1=op_data.get("level1", 99),
-                level2=op_data.get("level2", 99),
-                level3=op_data.get("level3", 0),
-                level4=op_data.get("level4", 0),
-                velocity_sensitivity=op_data.get("velocity_sensitivity", 0),
-                key_rate_scaling=op_data.get("key_rate_scaling", 0),
-                kls=kls,
-            )
-
+        for i, params in enumerate(patch.operators):
             self.operators[i] = Operator(params=params,
                                           sample_rate=self.sample_rate)
 
@@ -44,7 +44,7 @@ class VX7App:
         self._panel.pack(fill="both", expand=True)
 
         # Keyboard shortcut: Escape to quit.
-        self.root.bind("<Escape>", lambda e: self.root.destroy())
+        self.root.bind("<Escape>", self._on_escape)
 
         # Computer keyboard -> piano key mapping.
         self._setup_computer_keyboard()
@@ -121,6 +121,10 @@ class VX7App:
             note = self._key_map[key]
             self._panel._key_release(note)
 
+    def _on_escape(self, _event: tk.Event) -> None:
+        """Escape -> close the window."""
+        self.root.destroy()
+
     def _on_preset_up(self, _event: tk.Event) -> None:
         """Arrow Up -> next preset (higher number)."""
         self._panel.navigate_preset(1)
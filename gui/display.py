@@ -20,6 +20,10 @@ from .styles import (
 )
 
 
+# Right-justified 2-character patch number fields for set_patch().
+_PATCH_NUM_STRS = tuple(f"{n:>2d}" for n in range(100))
+
+
 class LCDDisplay(tk.Canvas):
     """Canvas-based LCD display emulating the DX7 two-line screen.
 
@@ -72,6 +76,12 @@ class LCDDisplay(tk.Canvas):
         self._id_text2: int = 0
         self._ids_grid: list[int] = []
 
+        # State queued by set_state(), applied together on the next idle.
+        self._pending_line1: Optional[str] = None
+        self._pending_line2: Optional[str] = None
+        self._pending_flash_ms: Optional[int] = None
+        self._apply_scheduled = False
+
         self._draw_bezel()
         self._draw_lcd_background()
         self._draw_scanlines()
@@ -213,6 +223,7 @@ class LCDDisplay(tk.Canvas):
             fill=LCD_GLOW,
             anchor="center",
             stipple="gray50",
+            tags=("lcd_line1",),
         )
         # Crisp text on top.
         self._id_text1 = self.create_text(
@@ -221,6 +232,7 @@ class LCDDisplay(tk.Canvas):
             font=LCD_FONT,
             fill=LCD_TEXT,
             anchor="center",
+            tags=("lcd_line1",),
         )
 
         # Line 2 -- lower half.
@@ -233,6 +245,7 @@ class LCDDisplay(tk.Canvas):
             fill=LCD_GLOW,
             anchor="center",
             stipple="gray50",
+            tags=("lcd_line2",),
         )
         self._id_text2 = self.create_text(
             cx, y2,
@@ -240,6 +253,7 @@ class LCDDisplay(tk.Canvas):
             font=LCD_FONT_SMALL,
             fill=LCD_TEXT,
             anchor="center",
+            tags=("lcd_line2",),
         )
 
     # ------------------------------------------------------------------
@@ -248,15 +262,22 @@ class LCDDisplay(tk.Canvas):
 
     def set_line1(self, text: str) -> None:
         """Set the top line of the LCD (max 16 characters)."""
-        self._line1 = text[:LCD_CHAR_WIDTH].ljust(LCD_CHAR_WIDTH)
-        self.itemconfigure(self._id_text1, text=self._line1)
-        self.itemconfigure(self._id_glow1, text=self._line1)
+        self._pending_line1 = None  # a direct write supersedes queued text
+        text = text[:LCD_CHAR_WIDTH].ljust(LCD_CHAR_WIDTH)
+        if text == self._line1:
+            return  # unchanged: skip the text relayout
+        self._line1 = text
+        # Glow and crisp layers share a tag, so one call updates both.
+        self.itemconfigure("lcd_line1", text=text)
 
     def set_line2(self, text: str) -> None:
         """Set the bottom line of the LCD (max 16 characters)."""
-        self._line2 = text[:LCD_CHAR_WIDTH].ljust(LCD_CHAR_WIDTH)
-        self.itemconfigure(self._id_text2, text=self._line2)
-        self.itemconfigure(self._id_glow2, text=self._line2)
+        self._pending_line2 = None
+        text = text[:LCD_CHAR_WIDTH].ljust(LCD_CHAR_WIDTH)
+        if text == self._line2:
+            return
+        self._line2 = text
+        self.itemconfigure("lcd_line2", text=text)
 
     def set_patch(self, number: int, name: str) -> None:
         """Convenience: set line 1 to a formatted patch display.
@@ -264,11 +285,54 @@ class LCDDisplay(tk.Canvas):
         Shows the patch number right-justified in a 2-digit field,
         followed by the patch name, e.g. " 1 E.PIANO 1   ".
         """
-        num_str = f"{number:>2d}"
+        if 0 <= number < len(_PATCH_NUM_STRS):
+            num_str = _PATCH_NUM_STRS[number]
+        else:
+            num_str = f"{number:>2d}"
         # Remaining space for name: 16 - 2 (number) - 1 (space) = 13 chars
         name_str = name[:13].ljust(13)
         self.set_line1(f"{num_str} {name_str}")
 
+    def set_state(
+        self,
+        line1: Optional[str] = None,
+        line2: Optional[str] = None,
+        flash_ms: Optional[int] = None,
+    ) -> None:
+        """Queue LCD changes to be applied together on the next idle cycle.
+
+        Any number of calls within one event collapse into a single update;
+        the latest value given for each field wins.
+
+        Parameters
+        ----------
+        line1, line2 : str or None
+            New text for the top / bottom line, or None to leave it.
+        flash_ms : int or None
+            Flash the display for this many milliseconds after the text
+            is updated, or None for no flash.
+        """
+        if line1 is not None:
+            self._pending_line1 = line1
+        if line2 is not None:
+            self._pending_line2 = line2
+        if flash_ms is not None:
+            self._pending_flash_ms = flash_ms
+        if not self._apply_scheduled:
+            self._apply_scheduled = True
+            self.after_idle(self._apply)
+
+    def _apply(self) -> None:
+        """Apply the state queued by :meth:`set_state`."""
+        self._apply_scheduled = False
+        if self._pending_line1 is not None:
+            self.set_line1(self._pending_line1)
+        if self._pending_line2 is not None:
+            self.set_line2(self._pending_line2)
+        if self._pending_flash_ms is not None:
+            self.flash(self._pending_flash_ms)
+            self._pending_flash_ms = None
+
     def clear(self) -> None:
         """Clear both lines."""
         self.set_line1("")
@@ -24,8 +24,14 @@ of the keyboard, and a 7-segment LED patch number display.
 
 from __future__ import annotations
 
+import functools
+import inspect
+import math
 import tkinter as tk
-from typing import Callable, Optional
+import tkinter.font as tkfont
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
 
 from .styles import (
     # Colors
@@ -64,6 +70,10 @@ from .styles import (
 )
 from .display import LCDDisplay
 
+# Coalesced repaints (hover, wheel drags, algorithm changes) are flushed at
+# most once per frame (~60 Hz).
+_FRAME_MS = 16
+
 
 # ======================================================================
 # Callback type aliases
@@ -74,6 +84,29 @@ PresetCallback = Callable[[int], None]           # (index,)
 ParamCallback = Callable[[str, object], None]    # (param_name, value)
 
 
+def _ignore_param(_name: str, _value: object) -> None:
+    """Parameter callback used while none is set, so callers need no check."""
+
+
+def _weak_callback(cb: Optional[Callable]) -> Optional[Callable]:
+    """Hold a bound-method callback without keeping its owner alive.
+
+    Plain functions, lambdas and partials are returned unchanged, since
+    the panel may hold the only reference to them.  A wrapped callback
+    whose owner has been collected does nothing.
+    """
+    if not inspect.ismethod(cb):
+        return cb
+    ref = weakref.WeakMethod(cb)
+
+    def call(*args):
+        method = ref()
+        if method is not None:
+            method(*args)
+
+    return call
+
+
 # ======================================================================
 # 7-segment digit encoding
 # ======================================================================
@@ -122,6 +155,239 @@ def _rounded_rect(
     return canvas.create_polygon(points, smooth=True, **kwargs)
 
 
+def _put_rounded_rect(
+    image: tk.PhotoImage,
+    x0: int, y0: int, x1: int, y1: int,
+    radius: int,
+    color: str,
+) -> None:
+    """Paint a filled rounded rectangle into a PhotoImage.
+
+    The rectangle covers pixels ``x0 <= x < x1`` and ``y0 <= y < y1``;
+    each corner row is shortened to follow a circle of *radius*.
+    """
+    r = max(0, min(radius, (x1 - x0) // 2, (y1 - y0) // 2))
+    image.put(color, to=(x0, y0 + r, x1, y1 - r))
+    for i in range(r):
+        inset = r - round(math.sqrt(r * r - (r - i - 0.5) ** 2))
+        image.put(color, to=(x0 + inset, y0 + i, x1 - inset, y0 + i + 1))
+        image.put(color, to=(x0 + inset, y1 - i - 1, x1 - inset, y1 - i))
+
+
+@functools.lru_cache(maxsize=None)
+def _led_bitmap(radius: int, fill: str, outline: str) -> tk.PhotoImage:
+    """Return a shared bitmap of a round LED of *radius* with a 1-pixel ring.
+
+    The image is ``2 * radius + 1`` pixels square, the size of the canvas
+    oval it replaces; pixels outside the circle stay transparent.
+    Requires a Tk root to exist.
+    """
+    d = 2 * radius + 1
+    image = tk.PhotoImage(width=d, height=d)
+    _put_rounded_rect(image, 0, 0, d, d, radius, outline)
+    _put_rounded_rect(image, 1, 1, d - 1, d - 1, radius - 1, fill)
+    return image
+
+
+def _put_track(image: tk.PhotoImage, x0: int, y0: int, h: int) -> None:
+    """Paint a 6-pixel-wide outlined wheel groove into a PhotoImage.
+
+    Matches a canvas rectangle from ``(x0, y0)`` to ``(x0 + 6, y0 + h)``.
+    """
+    image.put(BORDER_COLOR, to=(x0, y0, x0 + 7, y0 + h + 1))
+    image.put(WHEEL_TRACK, to=(x0 + 1, y0 + 1, x0 + 6, y0 + h))
+
+
+# Wheel scale marks sit at these fractions of the track height.
+_WHEEL_SCALE_FRACS = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+
+def _put_scale_marks(image: tk.PhotoImage, x0: int, y0: int, h: int) -> None:
+    """Paint the 2-pixel scale ticks left of a wheel track of height *h*.
+
+    All ticks go in one ``put`` of a 2-pixel-wide column whose rows are
+    either a tick or the wheel panel colour.
+    """
+    marks = {int(h * frac) for frac in _WHEEL_SCALE_FRACS}
+    rows = " ".join(
+        f"{{{LABEL_COLOR} {LABEL_COLOR}}}" if dy in marks
+        else f"{{{GROUP_BG} {GROUP_BG}}}"
+        for dy in range(h + 1)
+    )
+    image.put(rows, to=(x0, y0))
+
+
+@functools.lru_cache(maxsize=None)
+def _button_bitmap(
+    w: int, h: int, radius: int, fill: str,
+) -> tk.PhotoImage:
+    """Return a shared bitmap of a *w* x *h* membrane button face.
+
+    The face has the button outline, *fill*, and the shadow and highlight
+    lines painted in; pixels outside the rounded corners stay
+    transparent.  Every button of the same size and colour shows the
+    same image.  The cache is unbounded on purpose: it is what keeps the
+    images alive (Tk deletes an image when its Python object is
+    collected), and only a few dozen size/colour pairs exist.  Requires a
+    Tk root to exist.
+    """
+    image = tk.PhotoImage(width=w + 1, height=h + 1)
+    _put_rounded_rect(image, 0, 0, w + 1, h + 1, radius, BORDER_COLOR)
+    _put_rounded_rect(image, 1, 1, w, h, radius - 1, fill)
+    image.put("#3A3530", to=(3, h - 1, w - 3, h))  # shadow
+    image.put("#4A4540", to=(3, 1, w - 3, 2))      # highlight
+    return image
+
+
+@functools.lru_cache(maxsize=None)
+def _named_font(spec: tuple) -> tkfont.Font:
+    """Return a shared Tk named font for a ``(family, size, *styles)`` spec.
+
+    Passing a named font to ``create_text`` lets Tk reuse the font
+    directly instead of parsing the tuple spec for every text item.  The
+    cache also keeps each Font alive (Tk deletes a named font when its
+    Python object is collected).  Requires a Tk root to exist.
+    """
+    family, size, *styles = spec
+    return tkfont.Font(
+        family=family, size=size,
+        weight="bold" if "bold" in styles else "normal",
+        slant="italic" if "italic" in styles else "roman",
+    )
+
+
+# ======================================================================
+# Algorithm diagram geometry
+# ======================================================================
+
+AlgoLine = tuple[float, float, float, float]       # (x0, y0, x1, y1)
+AlgoBox = tuple[int, float, float, bool]           # (op, cx, cy, is_carrier)
+
+# ALGO+/ALGO- step tables, indexed by the current algorithm (1-32).
+_NUM_ALGOS = len(ALGORITHMS)
+_ALGO_NEXT = tuple(min(_NUM_ALGOS, n + 1) for n in range(_NUM_ALGOS + 1))
+_ALGO_PREV = tuple(max(1, n - 1) for n in range(_NUM_ALGOS + 1))
+
+# Carrier set of every algorithm as a 6-bit mask (bit op-1), index algo - 1.
+_ALGO_CARRIER_MASK = tuple(
+    sum(1 << (op - 1) for op in carriers) for _, carriers in ALGORITHMS
+)
+
+
+def _compute_algo_geometry(
+    algo_num: int,
+) -> tuple[tuple[AlgoLine, ...], tuple[AlgoBox, ...]]:
+    """Return the connection lines and operator boxes for an algorithm.
+
+    The layout only depends on the (static) algorithm table and display
+    size; see ``_ALGO_GEOMETRY`` for the precomputed results.
+    """
+    w = ALGO_DISPLAY_WIDTH
+    h = ALGO_DISPLAY_HEIGHT
+    connections, carriers = ALGORITHMS[algo_num - 1]
+    cmask = _ALGO_CARRIER_MASK[algo_num - 1]
+
+    # Carriers on bottom row, modulators stacked above, evenly spaced.
+    op_positions: dict[int, tuple[float, float]] = {}
+    modulators = [op for op in range(1, 7) if not cmask >> (op - 1) & 1]
+    nc = len(carriers)
+    for i, op in enumerate(carriers):
+        op_positions[op] = ((i + 0.5) / max(nc, 1) * (w - 30) + 15, h - 20)
+    nm = len(modulators)
+    for i, op in enumerate(modulators):
+        op_positions[op] = ((i + 0.5) / max(nm, 1) * (w - 30) + 15, 26)
+
+    lines = tuple(
+        op_positions[from_op] + op_positions[to_op]
+        for from_op, to_op in connections
+        if from_op in op_positions and to_op in op_positions
+    )
+    boxes = tuple(
+        (op, *op_positions[op], bool(cmask >> (op - 1) & 1))
+        for op in range(1, 7)
+        if op in op_positions
+    )
+    return lines, boxes
+
+
+# Geometry of every algorithm, computed once at import (index algo - 1).
+_ALGO_GEOMETRY = tuple(
+    _compute_algo_geometry(n) for n in range(1, len(ALGORITHMS) + 1)
+)
+
+
+# ======================================================================
+# MembraneGroup -- shared bindings and hover batching of membrane buttons
+# ======================================================================
+
+class MembraneGroup:
+    """The :class:`MembraneButton` objects drawn on one canvas.
+
+    Every button of the group carries the "membrane" tag, whose handlers
+    are registered once and look up the button owning the current item.
+    Hover repaints are coalesced and flushed at most once per frame, so
+    sweeping the pointer across a row of buttons does not issue a pair of
+    canvas updates for every <Enter>/<Leave>.
+
+    Parameters
+    ----------
+    canvas : tk.Canvas
+        The canvas the buttons are drawn on.
+    """
+
+    def __init__(self, canvas: tk.Canvas) -> None:
+        self.canvas = canvas
+
+        # Buttons by body item id.
+        self.owners: dict[int, MembraneButton] = {}
+
+        # Buttons whose hover face changed since the last flush.
+        self._hover_dirty: set[MembraneButton] = set()
+        self._hover_after: Optional[str] = None
+
+        # The handlers ignore the event, so they are registered as plain
+        # Tcl commands with no %-substitutions: Tk calls straight into
+        # Python and tkinter never builds an Event object.
+        for sequence, method in (
+            ("<Enter>", MembraneButton._on_enter),
+            ("<Leave>", MembraneButton._on_leave),
+            ("<ButtonPress-1>", MembraneButton._on_press),
+            ("<ButtonRelease-1>", MembraneButton._on_release),
+        ):
+            canvas.tag_bind("membrane", sequence, canvas.register(
+                functools.partial(self._dispatch, method)
+            ))
+
+    def _dispatch(self, method: Callable) -> None:
+        """Call *method* on the button owning the canvas' current item."""
+        current = self.canvas.find_withtag("current")
+        if current:
+            btn = self.owners.get(current[0])
+            if btn is not None:
+                method(btn)
+
+    def schedule_hover(self, btn: "MembraneButton") -> None:
+        """Show *btn*'s target face on the next hover flush."""
+        self._hover_dirty.add(btn)
+        if self._hover_after is None:
+            self._hover_after = self.canvas.after(_FRAME_MS, self._flush_hover)
+
+    def _flush_hover(self) -> None:
+        """Apply the latest queued hover state of every dirty button."""
+        dirty = self._hover_dirty
+        self._hover_dirty = set()
+        self._hover_after = None
+        for btn in dirty:
+            btn._show_face(btn._target_face)
+
+    def cancel_hover(self) -> None:
+        """Drop queued hover repaints and cancel the pending flush."""
+        self._hover_dirty.clear()
+        if self._hover_after is not None:
+            self.canvas.after_cancel(self._hover_after)
+            self._hover_after = None
+
+
 # ======================================================================
 # MembraneButton -- a single DX7-style membrane button on a Canvas
 # ======================================================================
@@ -131,8 +397,8 @@ class MembraneButton:
 
     Parameters
     ----------
-    canvas : tk.Canvas
-        The canvas to draw on.
+    group : MembraneGroup
+        Group of the canvas to draw on.
     x, y : float
         Top-left corner position.
     width, height : float
@@ -155,7 +421,7 @@ class MembraneButton:
 
     def __init__(
         self,
-        canvas: tk.Canvas,
+        group: MembraneGroup,
         x: float,
         y: float,
         width: float = MEMBRANE_BUTTON_WIDTH,
@@ -168,7 +434,8 @@ class MembraneButton:
         font: tuple = BUTTON_FONT,
         text_color: str = BUTTON_TEXT,
     ) -> None:
-        self.canvas = canvas
+        self.group = group
+        self.canvas = canvas = group.canvas
         self.x = x
         self.y = y
         self.w = width
@@ -179,57 +446,66 @@ class MembraneButton:
         self.command = command
         self.toggle = toggle
         self._state = False  # toggle state
-
-        # Draw button body.
-        self._body = _rounded_rect(
-            canvas, x, y, x + width, y + height,
-            radius=MEMBRANE_BUTTON_RADIUS,
-            fill=color, outline=BORDER_COLOR, width=1,
-        )
-
-        # Shadow line at bottom for 3-D look.
-        self._shadow = canvas.create_line(
-            x + 3, y + height - 1, x + width - 3, y + height - 1,
-            fill="#3A3530", width=1,
-        )
-
-        # Highlight line at top.
-        self._highlight = canvas.create_line(
-            x + 3, y + 1, x + width - 3, y + 1,
-            fill="#4A4540", width=1,
+        tags = ("membrane",)
+
+        # Draw button body: one image item showing a cached bitmap of the
+        # button face (outline, fill, shadow and highlight baked in).  State
+        # changes swap between the normal, active and pressed bitmaps.
+        self._face = self._face_for(color)
+        self._face_active = self._face_for(active_color)
+        self._face_pressed = self._face_for(BUTTON_PRESSED)
+        self._body = canvas.create_image(
+            x, y, image=self._face, anchor="nw", tags=tags,
         )
+        self._visible_face = self._face
+        self._target_face = self._face
 
         # Text label.
         self._label = canvas.create_text(
             x + width / 2, y + height / 2,
-            text=text, font=font, fill=text_color,
-            anchor="center",
+            text=text, font=_named_font(font), fill=text_color,
+            anchor="center", state="disabled",
         )
 
-        # Bind events to all parts.
-        for item in (self._body, self._label):
-            canvas.tag_bind(item, "<Enter>", self._on_enter)
-            canvas.tag_bind(item, "<Leave>", self._on_leave)
-            canvas.tag_bind(item, "<ButtonPress-1>", self._on_press)
-            canvas.tag_bind(item, "<ButtonRelease-1>", self._on_release)
+        group.owners[self._body] = self
+
+    def _face_for(self, fill: str) -> tk.PhotoImage:
+        return _button_bitmap(
+            int(self.w), int(self.h), MEMBRANE_BUTTON_RADIUS, fill,
+        )
+
+    def _show_face(self, face: tk.PhotoImage) -> None:
+        """Make *face* the bitmap shown by the button body."""
+        self._target_face = face
+        if face is self._visible_face:
+            return
+        self.canvas.itemconfigure(self._body, image=face)
+        self._visible_face = face
+
+    def _resting_face(self) -> tk.PhotoImage:
+        """Face to show when the pointer is not over the button."""
+        return self._face_active if (self.toggle and self._state) else self._face
+
+    def _schedule_hover(self, face: tk.PhotoImage) -> None:
+        """Queue *face* to be shown on the next hover flush."""
+        self._target_face = face
+        self.group.schedule_hover(self)
 
     # Interaction -------------------------------------------------------
 
-    def _on_enter(self, _event: tk.Event) -> None:
-        self.canvas.itemconfigure(self._body, fill=self.active_color)
+    def _on_enter(self) -> None:
+        self._schedule_hover(self._face_active)
 
-    def _on_leave(self, _event: tk.Event) -> None:
-        fill = self.active_color if (self.toggle and self._state) else self.color
-        self.canvas.itemconfigure(self._body, fill=fill)
+    def _on_leave(self) -> None:
+        self._schedule_hover(self._resting_face())
 
-    def _on_press(self, _event: tk.Event) -> None:
-        self.canvas.itemconfigure(self._body, fill=BUTTON_PRESSED)
+    def _on_press(self) -> None:
+        self._show_face(self._face_pressed)
 
-    def _on_release(self, _event: tk.Event) -> None:
+    def _on_release(self) -> None:
         if self.toggle:
             self._state = not self._state
-        fill = self.active_color if (self.toggle and self._state) else self.color
-        self.canvas.itemconfigure(self._body, fill=fill)
+        self._show_face(self._resting_face())
         if self.command:
             self.command()
 
@@ -242,15 +518,470 @@ class MembraneButton:
     @state.setter
     def state(self, value: bool) -> None:
         self._state = bool(value)
-        fill = self.active_color if self._state else self.color
-        self.canvas.itemconfigure(self._body, fill=fill)
+        self._show_face(self._face_active if self._state else self._face)
 
     def set_color(self, color: str, active_color: str | None = None) -> None:
         self.color = color
+        self._face = self._face_for(color)
         if active_color:
             self.active_color = active_color
-        fill = self.active_color if (self.toggle and self._state) else self.color
-        self.canvas.itemconfigure(self._body, fill=fill)
+            self._face_active = self._face_for(active_color)
+        self._show_face(self._resting_face())
+
+
+# ======================================================================
+# ButtonPool -- many stateless membrane buttons sharing one set of bindings
+# ======================================================================
+
+class ButtonPool:
+    """Flyweight membrane buttons drawn on one canvas.
+
+    Unlike :class:`MembraneButton`, a pooled button is not an object:
+    button *i* is just ``body_ids[i]``, ``sizes[i]``, ``text_ids[i]``,
+    ``colors[i]``, ``active_colors[i]``, ``fills[i]`` and ``commands[i]``.
+    The body is an image item showing the shared face bitmap for the
+    button's size and current fill (see ``_button_bitmap``).  Bodies carry
+    the pool's tag, so four bindings serve all buttons and the item under
+    the pointer is mapped back to its index.  Pooled buttons are
+    momentary (no toggle state).
+
+    Parameters
+    ----------
+    canvas : tk.Canvas
+        The canvas to draw on.
+    tag : str
+        Canvas tag shared by every item of the pool.
+    """
+
+    def __init__(self, canvas: tk.Canvas, tag: str) -> None:
+        self.canvas = canvas
+        self.tag = tag
+
+        self.body_ids: list[int] = []
+        self.sizes: list[tuple[int, int]] = []
+        self.text_ids: list[int] = []
+        self.colors: list[str] = []
+        self.active_colors: list[str] = []
+        self.fills: list[str] = []  # fill currently shown
+        self.commands: list[Optional[Callable]] = []
+
+        self._item_index: dict[int, int] = {}
+
+        # Hover repaints (index -> hovered) waiting for the next flush.
+        self._hover_pending: dict[int, bool] = {}
+        self._hover_after: Optional[str] = None
+
+        for sequence, handler in (
+            ("<Enter>", self._on_enter),
+            ("<Leave>", self._on_leave),
+            ("<ButtonPress-1>", self._on_press),
+            ("<ButtonRelease-1>", self._on_release),
+        ):
+            canvas.tag_bind(tag, sequence, canvas.register(handler))
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        width: float = MEMBRANE_BUTTON_WIDTH,
+        height: float = MEMBRANE_BUTTON_HEIGHT,
+        text: str = "",
+        color: str = BUTTON_COLOR,
+        active_color: str = BUTTON_ACTIVE,
+        command: Optional[Callable] = None,
+        font: tuple = BUTTON_FONT,
+        text_color: str = BUTTON_TEXT,
+    ) -> int:
+        """Draw a button at (*x*, *y*) and return its pool index."""
+        c = self.canvas
+        size = (int(width), int(height))
+        body = c.create_image(
+            x, y, image=_button_bitmap(*size, MEMBRANE_BUTTON_RADIUS, color),
+            anchor="nw", tags=(self.tag,),
+        )
+        label = c.create_text(
+            x + width / 2, y + height / 2,
+            text=text, font=_named_font(font), fill=text_color,
+            anchor="center", state="disabled",
+        )
+
+        i = len(self.body_ids)
+        self.body_ids.append(body)
+        self.sizes.append(size)
+        self.text_ids.append(label)
+        self.colors.append(color)
+        self.active_colors.append(active_color)
+        self.fills.append(color)
+        self.commands.append(command)
+        self._item_index[body] = i
+        return i
+
+    def _under_pointer(self) -> int:
+        """Index of the pooled button under the pointer, or -1."""
+        current = self.canvas.find_withtag("current")
+        if not current:
+            return -1
+        return self._item_index.get(current[0], -1)
+
+    def _paint(self, i: int, fill: str) -> None:
+        if fill != self.fills[i]:
+            self.fills[i] = fill
+            face = _button_bitmap(*self.sizes[i], MEMBRANE_BUTTON_RADIUS, fill)
+            self.canvas.itemconfigure(self.body_ids[i], image=face)
+
+    def _schedule_hover(self, i: int, hover: bool) -> None:
+        """Queue a hover repaint, coalesced like MembraneGroup's."""
+        self._hover_pending[i] = hover
+        if self._hover_after is None:
+            self._hover_after = self.canvas.after(_FRAME_MS, self._flush_hover)
+
+    def _flush_hover(self) -> None:
+        """Paint the latest queued hover state of every dirty button."""
+        pending = self._hover_pending
+        self._hover_pending = {}
+        self._hover_after = None
+        for i, hover in pending.items():
+            self._paint(i, self.active_colors[i] if hover else self.colors[i])
+
+    def cancel_hover(self) -> None:
+        """Drop queued hover repaints and cancel the pending flush."""
+        self._hover_pending.clear()
+        if self._hover_after is not None:
+            self.canvas.after_cancel(self._hover_after)
+            self._hover_after = None
+
+    # Interaction -------------------------------------------------------
+
+    def _on_enter(self) -> None:
+        i = self._under_pointer()
+        if i >= 0:
+            self._schedule_hover(i, True)
+
+    def _on_leave(self) -> None:
+        i = self._under_pointer()
+        if i >= 0:
+            self._schedule_hover(i, False)
+
+    def _on_press(self) -> None:
+        i = self._under_pointer()
+        if i >= 0:
+            self._hover_pending.pop(i, None)
+            self._paint(i, BUTTON_PRESSED)
+
+    def _on_release(self) -> None:
+        i = self._under_pointer()
+        if i < 0:
+            return
+        self._hover_pending.pop(i, None)
+        self._paint(i, self.colors[i])
+        command = self.commands[i]
+        if command:
+            command()
+
+
+# ======================================================================
+# WheelState -- drag state of a pitch-bend / modulation wheel
+# ======================================================================
+
+@dataclass(slots=True)
+class WheelState:
+    """Geometry and drag state of one wheel handle.
+
+    Attributes
+    ----------
+    y_top, y_bot : int
+        Vertical extent of the wheel track.
+    handle_h : int
+        Handle height.
+    current_y : int
+        Current top edge of the handle (the handle is moved by deltas).
+    center_y : int
+        Track center, where a spring-back wheel returns on release.
+    spring_back : bool
+        Whether the handle returns to center on release.
+    dragging : bool
+        Whether a drag is in progress.
+    pending_y : int or None
+        Pointer y of the latest drag event not yet applied.
+    steps : int
+        Resolution of the reported value: it changes only when
+        ``int(value * steps)`` does (127 for a 7-bit controller).
+    sent : int
+        Quantized value last reported (-1 = none yet).
+    y_max : int
+        Lowest top edge the handle can take (``y_bot - handle_h``).
+    half_h : int
+        Half the handle height, the grab offset from the pointer.
+    center_top : int
+        Handle top edge when centered (the spring-back target).
+    """
+
+    y_top: int
+    y_bot: int
+    handle_h: int
+    current_y: int
+    center_y: int = 0
+    spring_back: bool = False
+    dragging: bool = False
+    pending_y: Optional[int] = None
+    steps: int = 127
+    sent: int = -1
+    y_max: int = field(init=False)
+    half_h: int = field(init=False)
+    center_top: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.y_max = self.y_bot - self.handle_h
+        self.half_h = self.handle_h // 2
+        self.center_top = self.center_y - self.half_h
+
+    def clamp(self, y: int) -> int:
+        """Handle top edge for a pointer at *y*, kept within the track."""
+        ny = y - self.half_h
+        if ny < self.y_top:
+            return self.y_top
+        if ny > self.y_max:
+            return self.y_max
+        return ny
+
+    def needs_report(self, value: float) -> bool:
+        """Whether *value* differs from the last reported one at ``steps``."""
+        q = int(value * self.steps)
+        if q == self.sent:
+            return False
+        self.sent = q
+        return True
+
+
+# ======================================================================
+# SliderController -- every vertical slider on a canvas
+# ======================================================================
+
+class SliderController:
+    """Vertical sliders drawn on one canvas, kept as parallel state arrays.
+
+    Slider *k* is described by ``names[k]``, ``fill_ids[k]``,
+    ``handle_ids[k]``, ``grip_ids[k]`` and its geometry in ``x``, ``sw``,
+    ``y_top``, ``y_bot`` and ``handle_y``.  The handle and grip lines of
+    every slider share the ``"slider"`` tag, so one set of bindings serves
+    them all and the grabbed item is mapped back to its slider index.
+    Each slider's handle and grips also share a ``slider_knob<k>`` tag so
+    they move together with a single ``move`` call.
+
+    Parameters
+    ----------
+    canvas : tk.Canvas
+        The canvas to draw on.
+    on_change : callable(name: str, value: float)
+        Invoked with the new 0.0-1.0 value while a slider is dragged.
+        Motion events are coalesced, so it fires at most once per idle
+        cycle.
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        on_change: Callable[[str, float], None],
+    ) -> None:
+        self.canvas = canvas
+        self.on_change = on_change
+
+        self.names: list[str] = []
+        self.fill_ids: list[int] = []
+        self.handle_ids: list[int] = []
+        self.grip_ids: list[tuple[int, ...]] = []
+        self.x: list[int] = []
+        self.sw: list[int] = []
+        self.y_top: list[int] = []
+        self.y_bot: list[int] = []
+        self.handle_y: list[int] = []
+
+        self._item_index: dict[int, int] = {}
+        self._dragging = -1  # index of the slider being dragged
+
+        # Latest drag position, applied on the next idle cycle.
+        self.pending_frac = 0.0
+        self.pending_scheduled = False
+
+        canvas.tag_bind("slider", "<ButtonPress-1>", self._on_press)
+        canvas.tag_bind("slider", "<B1-Motion>", self._on_drag)
+        canvas.tag_bind("slider", "<ButtonRelease-1>", self._on_release)
+
+    def add(self, x: int, y: int, name: str, initial: float) -> int:
+        """Draw a slider at (*x*, *y*) and return its index."""
+        c = self.canvas
+        sw = SLIDER_WIDTH
+        sh = SLIDER_HEIGHT
+
+        # Groove.
+        groove_x = x + sw // 2 - 2
+        c.create_rectangle(
+            groove_x, y, groove_x + 4, y + sh,
+            fill=SLIDER_GROOVE, outline=BORDER_COLOR,
+        )
+
+        # Track fill.
+        fill_h = int(sh * (1 - initial))
+        fill_id = c.create_rectangle(
+            groove_x, y + fill_h, groove_x + 4, y + sh,
+            fill=SLIDER_FG, outline="",
+        )
+
+        k = len(self.names)
+        knob = ("slider", f"slider_knob{k}")
+
+        # Handle.
+        handle_y = y + fill_h - SLIDER_HANDLE_HEIGHT // 2
+        handle = c.create_rectangle(
+            x + 2, handle_y,
+            x + sw - 2, handle_y + SLIDER_HANDLE_HEIGHT,
+            fill=SLIDER_FG, outline=LABEL_COLOR, width=1,
+            tags=knob,
+        )
+
+        # Handle grip lines -- created once, moved with the handle.
+        grips = tuple(
+            c.create_line(
+                x + 6, handle_y + SLIDER_HANDLE_HEIGHT // 2 + dy,
+                x + sw - 6, handle_y + SLIDER_HANDLE_HEIGHT // 2 + dy,
+                fill=BUTTON_TEXT, width=1, tags=knob,
+            )
+            for dy in range(-2, 4, 2)
+        )
+
+        self.names.append(name)
+        self.fill_ids.append(fill_id)
+        self.handle_ids.append(handle)
+        self.grip_ids.append(grips)
+        self.x.append(x)
+        self.sw.append(sw)
+        self.y_top.append(y)
+        self.y_bot.append(y + sh)
+        self.handle_y.append(handle_y)
+        self._item_index[handle] = k
+        for gid in grips:
+            self._item_index[gid] = k
+        return k
+
+    # Interaction -------------------------------------------------------
+
+    def _on_press(self, _event: tk.Event) -> None:
+        current = self.canvas.find_withtag("current")
+        if current:
+            self._dragging = self._item_index.get(current[0], -1)
+
+    def _on_drag(self, event: tk.Event) -> None:
+        k = self._dragging
+        if k < 0:
+            return
+        y_top = self.y_top[k]
+        y_bot = self.y_bot[k]
+
+        # Clamp y.
+        ny = max(y_top, min(y_bot, event.y))
+        self.pending_frac = 1.0 - (ny - y_top) / (y_bot - y_top)
+        if not self.pending_scheduled:
+            self.pending_scheduled = True
+            self.canvas.after_idle(self._flush_slider, k)
+
+    def _flush_slider(self, k: int) -> None:
+        """Apply the latest drag position of slider *k*."""
+        self.pending_scheduled = False
+        c = self.canvas
+        frac = self.pending_frac
+        x = self.x[k]
+        sw = self.sw[k]
+        y_top = self.y_top[k]
+        y_bot = self.y_bot[k]
+        fy = y_top + int((y_bot - y_top) * (1 - frac))
+
+        # Shift the handle and its grip lines together, and move the top
+        # edge of the track fill with them.  Nothing is redrawn while the
+        # pointer stays on the same pixel row.
+        hy = fy - SLIDER_HANDLE_HEIGHT // 2
+        dy = hy - self.handle_y[k]
+        if dy:
+            c.move(f"slider_knob{k}", 0, dy)
+            c.coords(
+                self.fill_ids[k], x + sw // 2 - 2, fy, x + sw // 2 + 2, y_bot,
+            )
+            self.handle_y[k] = hy
+
+        self.on_change(self.names[k], frac)
+
+    def _on_release(self, _event: tk.Event) -> None:
+        self._dragging = -1
+
+
+# ======================================================================
+# 7-segment digit geometry
+# ======================================================================
+
+_SEG_DIGIT_W = 18  # digit width
+_SEG_DIGIT_H = 32  # digit height
+
+
+def _seven_seg_segments(w: int, h: int) -> tuple[tuple[int, int, int, int], ...]:
+    """Segments a-g of a *w* x *h* digit as (x0, y0, x1, y1) from its corner."""
+    return (
+        (2, 0, w - 2, 0),                    # a: horizontal top
+        (w, 2, w, h // 2 - 2),               # b: vertical top-right
+        (w, h // 2 + 2, w, h - 2),           # c: vertical bottom-right
+        (2, h, w - 2, h),                    # d: horizontal bottom
+        (0, h // 2 + 2, 0, h - 2),           # e: vertical bottom-left
+        (0, 2, 0, h // 2 - 2),               # f: vertical top-left
+        (2, h // 2, w - 2, h // 2),          # g: horizontal middle
+    )
+
+
+_SEVEN_SEG_SEGMENTS = _seven_seg_segments(_SEG_DIGIT_W, _SEG_DIGIT_H)
+
+def _seg_bits(flags: tuple[int, ...]) -> int:
+    """Pack 7-segment flags (a..g) into a bit mask (bit i = segment i)."""
+    return sum(1 << i for i, on in enumerate(flags) if on)
+
+
+@functools.lru_cache(maxsize=None)
+def _seven_seg_glyph(digit: int) -> tk.PhotoImage:
+    """Return a shared bitmap of one 7-segment digit (0-9).
+
+    Every segment is painted, lit or unlit, as a 3-pixel stroke with
+    rounded ends, matching the width-3 round-capped lines the display
+    used to draw.  The digit's corner sits at pixel (1, 1) so the end
+    caps fit; pixels between segments stay transparent.  The cache keeps
+    the images alive, as for ``_button_bitmap``.  Requires a Tk root.
+    """
+    image = tk.PhotoImage(width=_SEG_DIGIT_W + 3, height=_SEG_DIGIT_H + 3)
+    bits = _seg_bits(SEVEN_SEG_DIGITS[digit])
+    for seg_idx, (x0, y0, x1, y1) in enumerate(_SEVEN_SEG_SEGMENTS):
+        color = SEVEN_SEG_ON if bits >> seg_idx & 1 else SEVEN_SEG_OFF
+        x0, y0, x1, y1 = x0 + 1, y0 + 1, x1 + 1, y1 + 1
+        if y0 == y1:  # horizontal
+            image.put(color, to=(x0, y0 - 1, x1 + 1, y0 + 2))
+            image.put(color, to=(x0 - 1, y0, x0, y0 + 1))
+            image.put(color, to=(x1 + 1, y0, x1 + 2, y0 + 1))
+        else:  # vertical
+            image.put(color, to=(x0 - 1, y0, x0 + 2, y1 + 1))
+            image.put(color, to=(x0, y0 - 1, x0 + 1, y0))
+            image.put(color, to=(x0, y1 + 1, x0 + 1, y1 + 2))
+    return image
+
+
+# ======================================================================
+# Piano key tables
+# ======================================================================
+
+# Semitones (note % 12) that are black keys.
+_BLACK_SEMITONES = frozenset((1, 3, 6, 8, 10))
+
+# 1 for every MIDI note (0-127) that is a black key, 0 for white keys.
+_IS_BLACK = bytes(1 if n % 12 in _BLACK_SEMITONES else 0 for n in range(128))
+
+# Label of the C key in each octave, indexed by note // 12 (C1 = MIDI 24).
+_C_LABELS = tuple(f"C{octave - 1}" for octave in range(11))
+
+KeyBox = tuple[int, int, int, int]  # PhotoImage region (x0, y0, x1, y1)
+KeySprite = tuple[tuple[str, KeyBox], ...]  # (colour, region) puts
 
 
 # ======================================================================
@@ -266,6 +997,18 @@ class VX7Panel(tk.Frame):
         Parent widget (typically the root window).
     """
 
+    # State read on every key, drag and repaint event lives in slots; the
+    # rest (and tkinter's own attributes) stays in the instance __dict__
+    # inherited from tk.Frame.
+    __slots__ = (
+        "_on_note_on", "_on_note_off", "_on_preset_change", "_on_param_change",
+        "_current_algo", "_operator_mask", "_current_preset",
+        "_pressed_mask", "_volume",
+        "_pitch_bend", "_mod_wheel", "_wheel_flush_scheduled",
+        "_pending_key_paints", "_pending_op_paints",
+        "_visual_flush_scheduled", "_key_painted", "_op_painted",
+    )
+
     def __init__(self, parent: tk.Widget, **kwargs) -> None:
         super().__init__(parent, bg=BODY_COLOR, **kwargs)
 
@@ -273,18 +1016,36 @@ class VX7Panel(tk.Frame):
         self._on_note_on: Optional[NoteOnCallback] = None
         self._on_note_off: Optional[NoteOffCallback] = None
         self._on_preset_change: Optional[PresetCallback] = None
-        self._on_param_change: Optional[ParamCallback] = None
+        self._on_param_change: ParamCallback = _ignore_param
 
         # State.
         self._current_algo = 1
-        self._operator_states = [True] * 6  # All ops enabled.
+        self._operator_mask = 0b111111  # bit i set = operator i+1 enabled
         self._current_preset = 0
-        self._pressed_keys: set[int] = set()
+        self._pressed_mask = 0  # bit n set while MIDI note n is held
         self._volume = 0.8
 
         # Wheel state.
         self._pitch_bend = 0.5   # 0.5 = center
         self._mod_wheel = 0.0    # 0.0 = bottom
+        self._wheel_flush_scheduled = False
+
+        # Key and operator repaints queued for the next idle flush:
+        # note -> pressed, and the indices of operators to repaint.
+        self._pending_key_paints: dict[int, bool] = {}
+        self._pending_op_paints: set[int] = set()
+        self._visual_flush_scheduled = False
+        # What is currently on screen, so repaints that would not change
+        # anything (e.g. a toggle undone within one burst) are skipped.
+        self._key_painted = bytearray(128)
+        self._op_painted = self._operator_mask
+
+        # Algorithm changes are drawn at most once per frame; bursts of
+        # ALGO+/- presses only show the last one.
+        self._algo_redraw_scheduled = False
+
+        # (x_offset, y_offset, key width, white keys) of the built keyboard.
+        self._kb_geometry: Optional[tuple[int, int, int, int]] = None
 
         # Build the panel sections.
         self._build_header()
@@ -300,14 +1061,27 @@ class VX7Panel(tk.Frame):
         on_note_on: Optional[NoteOnCallback],
         on_note_off: Optional[NoteOffCallback],
     ) -> None:
-        self._on_note_on = on_note_on
-        self._on_note_off = on_note_off
+        self._on_note_on = _weak_callback(on_note_on)
+        self._on_note_off = _weak_callback(on_note_off)
 
     def set_preset_callback(self, cb: Optional[PresetCallback]) -> None:
-        self._on_preset_change = cb
+        self._on_preset_change = _weak_callback(cb)
 
     def set_param_callback(self, cb: Optional[ParamCallback]) -> None:
-        self._on_param_change = cb
+        self._on_param_change = _weak_callback(cb) or _ignore_param
+
+    def destroy(self) -> None:
+        """Destroy the panel.
+
+        Pending hover flushes are cancelled so none fires on a destroyed
+        canvas.
+        """
+        self._membranes.cancel_hover()
+        self._buttons.cancel_hover()
+        if self._preset_hover_after is not None:
+            self.after_cancel(self._preset_hover_after)
+            self._preset_hover_after = None
+        super().destroy()
 
     # ==================================================================
     # Header strip
@@ -321,20 +1095,34 @@ class VX7Panel(tk.Frame):
         )
         self._header.pack(fill="x", side="top")
 
+        # The strip's lines never change, so they are painted into one
+        # image rather than drawn as separate canvas items.
+        self._header_photo = tk.PhotoImage(
+            width=WINDOW_WIDTH, height=HEADER_HEIGHT,
+        )
         # Top highlight line.
-        self._header.create_line(
-            0, 1, WINDOW_WIDTH, 1, fill=HEADER_HIGHLIGHT, width=1,
+        self._header_photo.put(
+            HEADER_HIGHLIGHT, to=(0, 1, WINDOW_WIDTH, 2),
         )
         # Bottom shadow line.
-        self._header.create_line(
-            0, HEADER_HEIGHT - 1, WINDOW_WIDTH, HEADER_HEIGHT - 1,
-            fill=HEADER_SHADOW, width=1,
+        self._header_photo.put(
+            HEADER_SHADOW,
+            to=(0, HEADER_HEIGHT - 1, WINDOW_WIDTH, HEADER_HEIGHT),
+        )
+        # Decorative line separating branding from subtitle.
+        self._header_photo.put(
+            HEADER_SHADOW,
+            to=(100, HEADER_HEIGHT // 2,
+                WINDOW_WIDTH - 250, HEADER_HEIGHT // 2 + 1),
+        )
+        self._header.create_image(
+            0, 0, image=self._header_photo, anchor="nw",
         )
 
         # VX7 branding on the left.
         self._header.create_text(
             20, HEADER_HEIGHT // 2,
-            text="VX7", font=HEADER_FONT, fill=HEADER_TEXT,
+            text="VX7", font=_named_font(HEADER_FONT), fill=HEADER_TEXT,
             anchor="w",
         )
 
@@ -342,17 +1130,10 @@ class VX7Panel(tk.Frame):
         self._header.create_text(
             WINDOW_WIDTH - 20, HEADER_HEIGHT // 2 + 2,
             text="VIRTUAL DX7 SYNTHESIZER",
-            font=HEADER_FONT_SUB, fill="#505050",
+            font=_named_font(HEADER_FONT_SUB), fill="#505050",
             anchor="e",
         )
 
-        # Decorative line separating branding from subtitle.
-        self._header.create_line(
-            100, HEADER_HEIGHT // 2,
-            WINDOW_WIDTH - 250, HEADER_HEIGHT // 2,
-            fill=HEADER_SHADOW, width=1,
-        )
-
     # ==================================================================
     # Main area (everything between header and keyboard)
     # ==================================================================
@@ -371,11 +1152,28 @@ class VX7Panel(tk.Frame):
         )
         self._main_canvas.pack(fill="both", side="top")
 
+        # Static background: section panels and the row separator are
+        # painted into one image instead of being separate canvas items.
+        self._bg_photo = tk.PhotoImage(width=WINDOW_WIDTH, height=main_h)
+        self._main_canvas.create_image(
+            0, 0, image=self._bg_photo, anchor="nw",
+        )
+
         # Separator between row 1 and row 2.
         row2_y = 195
-        self._main_canvas.create_line(
-            10, row2_y - 5, WINDOW_WIDTH - 10, row2_y - 5,
-            fill=BORDER_COLOR, width=1,
+        self._bg_photo.put(
+            BORDER_COLOR, to=(10, row2_y - 5, WINDOW_WIDTH - 10, row2_y - 4),
+        )
+
+        # Preset arrow and operator buttons.
+        self._membranes = MembraneGroup(self._main_canvas)
+
+        # Momentary buttons of the FUNCTION and PARAMETERS sections.
+        self._buttons = ButtonPool(self._main_canvas, "pool_btn")
+
+        # Sliders of the MASTER and DATA ENTRY sections.
+        self._sliders = SliderController(
+            self._main_canvas, self._on_slider_change,
         )
 
         # Build Row 1 sections.
@@ -383,13 +1181,46 @@ class VX7Panel(tk.Frame):
         self._build_lcd_section()
         self._build_algorithm_section()
         self._build_operator_section()
-        self._build_master_section()
 
         # Build Row 2 sections.
         self._build_data_entry_section()
         self._build_memory_section()
-        self._build_function_section()
-        self._build_parameter_section()
+
+        # MASTER, FUNCTION and PARAMETERS hold no state the rest of the
+        # panel reads at startup, so they are built once the window is up.
+        self.after_idle(self._build_master_section)
+        self.after_idle(self._build_function_section)
+        self.after_idle(self._build_parameter_section)
+
+    def _section_label(
+        self, x: float, y: float, text: str, anchor: str = "nw",
+    ) -> None:
+        """Draw a static section title on the main canvas.
+
+        Titles are created "disabled" so Tk never considers them when
+        picking the item under the pointer.
+        """
+        self._main_canvas.create_text(
+            x, y, text=text, font=_named_font(SECTION_FONT),
+            fill=SECTION_LABEL_COLOR, anchor=anchor,
+            state="disabled", tags=("section_label",),
+        )
+
+    def _panel_background(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Paint a bordered section panel into the static background."""
+        _put_rounded_rect(self._bg_photo, x0, y0, x1 + 1, y1 + 1, 4, BORDER_COLOR)
+        _put_rounded_rect(self._bg_photo, x0 + 1, y0 + 1, x1, y1, 3, GROUP_BG)
+
+    def _display_background(
+        self, x: int, y: int, w: int, h: int, fill: str,
+    ) -> tuple[int, int]:
+        """Paint a *w* x *h* display well with a 1-pixel border at (x, y).
+
+        Returns the top-left corner of the area inside the border.
+        """
+        self._bg_photo.put(BORDER_COLOR, to=(x, y, x + w + 2, y + h + 2))
+        self._bg_photo.put(fill, to=(x + 1, y + 1, x + w + 1, y + h + 1))
+        return x + 1, y + 1
 
     # ------------------------------------------------------------------
     # ROW 1: 7-Segment Display (far left)
@@ -401,26 +1232,18 @@ class VX7Panel(tk.Frame):
         sy = 15
 
         # Section label.
-        self._main_canvas.create_text(
-            sx + SEVEN_SEG_WIDTH // 2, sy - 2,
-            text="PATCH", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="s",
+        self._section_label(
+            sx + SEVEN_SEG_WIDTH // 2, sy - 2, "PATCH", anchor="s",
         )
 
-        # Create the 7-segment canvas.
-        self._seg_canvas = tk.Canvas(
-            self._main_canvas,
-            width=SEVEN_SEG_WIDTH, height=SEVEN_SEG_HEIGHT,
-            bg=SEVEN_SEG_BG, highlightthickness=1,
-            highlightbackground=BORDER_COLOR,
-        )
-        self._main_canvas.create_window(
-            sx, sy, window=self._seg_canvas, anchor="nw",
+        # The display is drawn straight on the main canvas over a painted
+        # background well.
+        ox, oy = self._display_background(
+            sx, sy, SEVEN_SEG_WIDTH, SEVEN_SEG_HEIGHT, SEVEN_SEG_BG,
         )
 
         # Draw initial display (patch 01).
-        self._seg_items: list[list[int]] = [[], []]  # Two digits, each with 7 segments
-        self._draw_seven_seg_digits()
+        self._draw_seven_seg_digits(ox, oy)
         self.set_patch_number(1)
 
         # UP/DOWN arrow buttons below the 7-seg display for preset navigation.
@@ -430,99 +1253,63 @@ class VX7Panel(tk.Frame):
         arrow_y = sy + SEVEN_SEG_HEIGHT + 6
 
         MembraneButton(
-            self._main_canvas,
+            self._membranes,
             arrow_x, arrow_y,
             width=arrow_w, height=arrow_h,
             text="\u25B2", color=ACCENT_BLUE, active_color=ACCENT_BLUE_ACTIVE,
-            command=lambda: self.navigate_preset(1),
+            command=functools.partial(self.navigate_preset, 1),
             font=("Helvetica", 10, "bold"),
             text_color="#FFFFFF",
         )
 
         MembraneButton(
-            self._main_canvas,
+            self._membranes,
             arrow_x, arrow_y + arrow_h + 3,
             width=arrow_w, height=arrow_h,
             text="\u25BC", color=ACCENT_BLUE, active_color=ACCENT_BLUE_ACTIVE,
-            command=lambda: self.navigate_preset(-1),
+            command=functools.partial(self.navigate_preset, -1),
             font=("Helvetica", 10, "bold"),
             text_color="#FFFFFF",
         )
 
-    def _draw_seven_seg_digits(self) -> None:
-        """Create the segment line items for both digits on the 7-seg canvas."""
-        c = self._seg_canvas
-        # Digit dimensions.
-        dw = 18   # digit width
-        dh = 32   # digit height
-        seg_w = 3  # segment line width
+    def _draw_seven_seg_digits(self, ox: int, oy: int) -> None:
+        """Create the image item of each digit, inside the display at (ox, oy)."""
+        c = self._main_canvas
 
         # Positions: digit 0 (tens) at left, digit 1 (ones) at right.
         digit_x_positions = [12, 48]
-        digit_y = (SEVEN_SEG_HEIGHT - dh) // 2
-
-        for d_idx, dx in enumerate(digit_x_positions):
-            dy = digit_y
-            segs = []
-
-            # Segment a: horizontal top
-            segs.append(c.create_line(
-                dx + 2, dy, dx + dw - 2, dy,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
-            # Segment b: vertical top-right
-            segs.append(c.create_line(
-                dx + dw, dy + 2, dx + dw, dy + dh // 2 - 2,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
-            # Segment c: vertical bottom-right
-            segs.append(c.create_line(
-                dx + dw, dy + dh // 2 + 2, dx + dw, dy + dh - 2,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
-            # Segment d: horizontal bottom
-            segs.append(c.create_line(
-                dx + 2, dy + dh, dx + dw - 2, dy + dh,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
-            # Segment e: vertical bottom-left
-            segs.append(c.create_line(
-                dx, dy + dh // 2 + 2, dx, dy + dh - 2,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
-            # Segment f: vertical top-left
-            segs.append(c.create_line(
-                dx, dy + 2, dx, dy + dh // 2 - 2,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
-            # Segment g: horizontal middle
-            segs.append(c.create_line(
-                dx + 2, dy + dh // 2, dx + dw - 2, dy + dh // 2,
-                fill=SEVEN_SEG_OFF, width=seg_w, capstyle="round",
-            ))
+        digit_y = (SEVEN_SEG_HEIGHT - _SEG_DIGIT_H) // 2
 
-            self._seg_items[d_idx] = segs
+        # One image item per digit; the glyph's corner is at (1, 1).
+        self._seg_items: tuple[int, ...] = tuple(
+            c.create_image(
+                ox + dx - 1, oy + digit_y - 1,
+                image=_seven_seg_glyph(8), anchor="nw",
+            )
+            for dx in digit_x_positions
+        )
+        # Digit currently shown in each slot (-1 = none yet).
+        self._seg_shown: list[int] = [-1, -1]
 
     def set_patch_number(self, num: int) -> None:
         """Update the 7-segment display to show a patch number (1-32).
 
+        Each digit is one image item showing a cached glyph, so an update
+        swaps at most two images.
+
         Parameters
         ----------
         num : int
             Patch number to display (1-32).
         """
         num = max(1, min(32, num))
-        tens = num // 10
-        ones = num % 10
-
-        c = self._seg_canvas
-        for seg_idx, on in enumerate(SEVEN_SEG_DIGITS.get(tens, (0,) * 7)):
-            color = SEVEN_SEG_ON if on else SEVEN_SEG_OFF
-            c.itemconfigure(self._seg_items[0][seg_idx], fill=color)
-
-        for seg_idx, on in enumerate(SEVEN_SEG_DIGITS.get(ones, (0,) * 7)):
-            color = SEVEN_SEG_ON if on else SEVEN_SEG_OFF
-            c.itemconfigure(self._seg_items[1][seg_idx], fill=color)
+        c = self._main_canvas
+        for d_idx, digit in enumerate(divmod(num, 10)):
+            if digit != self._seg_shown[d_idx]:
+                self._seg_shown[d_idx] = digit
+                c.itemconfigure(
+                    self._seg_items[d_idx], image=_seven_seg_glyph(digit),
+                )
 
     def update_patch_number(self, num: int) -> None:
         """Public API alias for set_patch_number."""
@@ -538,10 +1325,7 @@ class VX7Panel(tk.Frame):
         sy = 8
 
         # Section label.
-        self._main_canvas.create_text(
-            sx, sy, text="DISPLAY", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="nw",
-        )
+        self._section_label(sx, sy, "DISPLAY", anchor="nw")
 
         # LCD display.
         self._lcd = LCDDisplay(self._main_canvas)
@@ -562,28 +1346,25 @@ class VX7Panel(tk.Frame):
         sx = 450
         sy = 8
 
-        self._main_canvas.create_text(
-            sx, sy, text="ALGORITHM", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="nw",
-        )
+        self._section_label(sx, sy, "ALGORITHM", anchor="nw")
 
         # Algorithm number shown next to the label, outside the diagram.
         self._algo_num_label = self._main_canvas.create_text(
             sx + ALGO_DISPLAY_WIDTH, sy -5,
-            text="1", font=("Courier", 16, "bold"),
+            text="1", font=_named_font(("Courier", 16, "bold")),
             fill=LCD_TEXT, anchor="ne",
         )
 
-        self._algo_canvas = tk.Canvas(
-            self._main_canvas,
-            width=ALGO_DISPLAY_WIDTH, height=ALGO_DISPLAY_HEIGHT,
-            bg=ALGO_BG, highlightthickness=1,
-            highlightbackground=BORDER_COLOR,
-        )
-        self._main_canvas.create_window(
-            sx, sy + 14, window=self._algo_canvas, anchor="nw",
+        # Diagrams are drawn on the main canvas, shifted to this origin.
+        self._algo_origin = self._display_background(
+            sx, sy + 14, ALGO_DISPLAY_WIDTH, ALGO_DISPLAY_HEIGHT, ALGO_BG,
         )
 
+        # 1 for every algorithm whose diagram group has been rendered
+        # (indexed by algorithm number), and the algorithm shown.
+        self._algo_rendered = bytearray(len(ALGORITHMS) + 1)
+        self._algo_shown = 0
+
         self.draw_algorithm(1)
 
     # ------------------------------------------------------------------
@@ -595,21 +1376,16 @@ class VX7Panel(tk.Frame):
         sx = 600
         sy = 8
 
-        self._main_canvas.create_text(
-            sx, sy, text="OPERATOR SELECT", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="nw",
-        )
+        self._section_label(sx, sy, "OPERATOR SELECT", anchor="nw")
 
         op_btn_y = sy + 14
 
         # Background panel for operator buttons.
         op_panel_w = 6 * (OP_BUTTON_SIZE + BUTTON_GAP) + 12
         op_panel_h = OP_BUTTON_SIZE + 28
-        _rounded_rect(
-            self._main_canvas,
+        self._panel_background(
             sx - 4, op_btn_y - 4,
             sx + op_panel_w, op_btn_y + op_panel_h,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
         )
 
         self._op_buttons: list[MembraneButton] = []
@@ -620,27 +1396,21 @@ class VX7Panel(tk.Frame):
             by = op_btn_y + 18
 
             # LED indicator above button.
-            led = self._main_canvas.create_oval(
+            led = self._main_canvas.create_image(
                 bx + OP_BUTTON_SIZE // 2 - OP_LED_RADIUS,
                 by - 10 - OP_LED_RADIUS,
-                bx + OP_BUTTON_SIZE // 2 + OP_LED_RADIUS,
-                by - 10 + OP_LED_RADIUS,
-                fill=LED_ON, outline=LED_GLOW, width=1,
+                image=_led_bitmap(OP_LED_RADIUS, LED_ON, LED_GLOW),
+                anchor="nw", tags=("op_led", f"op_led_{i}"),
             )
             self._op_leds.append(led)
 
-            def make_op_toggle(idx: int):
-                def toggle():
-                    self._toggle_operator(idx)
-                return toggle
-
             btn = MembraneButton(
-                self._main_canvas,
+                self._membranes,
                 bx, by,
                 width=OP_BUTTON_SIZE, height=OP_BUTTON_SIZE,
                 text=str(i + 1),
                 color=ACCENT_BLUE, active_color=ACCENT_BLUE_ACTIVE,
-                command=make_op_toggle(i),
+                command=functools.partial(self._toggle_operator, i),
                 toggle=True,
                 font=BUTTON_FONT,
                 text_color="#FFFFFF",
@@ -652,7 +1422,7 @@ class VX7Panel(tk.Frame):
         self._main_canvas.create_text(
             sx + op_panel_w // 2, op_btn_y + op_panel_h + 6,
             text="1     2     3     4     5     6",
-            font=LABEL_FONT, fill=LABEL_COLOR, anchor="n",
+            font=_named_font(LABEL_FONT), fill=LABEL_COLOR, anchor="n",
         )
 
     # ------------------------------------------------------------------
@@ -664,37 +1434,32 @@ class VX7Panel(tk.Frame):
         sx = 880
         sy = 8
 
-        self._main_canvas.create_text(
-            sx + 70, sy, text="MASTER", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="n",
-        )
+        self._section_label(sx + 70, sy, "MASTER", anchor="n")
 
         panel_w = 150
         panel_h = SLIDER_HEIGHT + 50
-        _rounded_rect(
-            self._main_canvas,
+        self._panel_background(
             sx, sy + 14,
             sx + panel_w, sy + 14 + panel_h,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
         )
 
         # Volume slider.
         vol_x = sx + 25
         self._main_canvas.create_text(
             vol_x + SLIDER_WIDTH // 2, sy + 28,
-            text="VOLUME", font=LABEL_FONT_BOLD,
+            text="VOLUME", font=_named_font(LABEL_FONT_BOLD),
             fill=LABEL_COLOR, anchor="n",
         )
-        self._build_slider(vol_x, sy + 42, "volume", self._volume)
+        self._sliders.add(vol_x, sy + 42, "volume", self._volume)
 
         # Tune slider.
         tune_x = sx + 95
         self._main_canvas.create_text(
             tune_x + SLIDER_WIDTH // 2, sy + 28,
-            text="TUNE", font=LABEL_FONT_BOLD,
+            text="TUNE", font=_named_font(LABEL_FONT_BOLD),
             fill=LABEL_COLOR, anchor="n",
         )
-        self._build_slider(tune_x, sy + 42, "tune", 0.5)
+        self._sliders.add(tune_x, sy + 42, "tune", 0.5)
 
     # ------------------------------------------------------------------
     # ROW 2: Data Entry slider + up/down buttons
@@ -706,25 +1471,20 @@ class VX7Panel(tk.Frame):
         sy = 200
 
         # Section label.
-        self._main_canvas.create_text(
-            sx + 25, sy, text="DATA ENTRY", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="n",
-        )
+        self._section_label(sx + 25, sy, "DATA ENTRY", anchor="n")
 
         # Background panel.
         panel_w = 52
         panel_h = SLIDER_HEIGHT + 20
-        _rounded_rect(
-            self._main_canvas,
+        self._panel_background(
             sx, sy + 14,
             sx + panel_w, sy + 14 + panel_h,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
         )
 
         # Data entry slider.
         slider_x = sx + (panel_w - SLIDER_WIDTH) // 2
         slider_y = sy + 24
-        self._build_slider(slider_x, slider_y, "data_entry", 0.5)
+        self._sliders.add(slider_x, slider_y, "data_entry", 0.5)
 
     # ------------------------------------------------------------------
     # ROW 2: Memory Select (32 preset buttons in 4 rows of 8)
@@ -736,10 +1496,7 @@ class VX7Panel(tk.Frame):
         sy = 200
 
         # Section label.
-        self._main_canvas.create_text(
-            sx, sy, text="MEMORY SELECT", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="nw",
-        )
+        self._section_label(sx, sy, "MEMORY SELECT", anchor="nw")
 
         bs = PRESET_BUTTON_SIZE + 2  # button + gap
         preset_y = sy + 14
@@ -747,36 +1504,50 @@ class VX7Panel(tk.Frame):
         # Background panel for presets.
         panel_w = 8 * bs + 8
         panel_h = 4 * bs + 8
-        _rounded_rect(
-            self._main_canvas,
+        self._panel_background(
             sx - 4, preset_y - 4,
             sx + panel_w, preset_y + panel_h,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
         )
 
-        self._preset_buttons: list[MembraneButton] = []
+        # The 32 presets are drawn directly as canvas items sharing the
+        # "preset" tag rather than as 32 MembraneButton instances; one set
+        # of tag bindings serves the whole grid and the hit item is mapped
+        # back to its preset index.  Each body is an image item showing the
+        # shared face bitmap for its current fill.
+        c = self._main_canvas
+        size = PRESET_BUTTON_SIZE
+        self._preset_body_ids: list[int] = []
+        self._preset_text_ids: list[int] = []
+        self._preset_item_index: dict[int, int] = {}
+        self._preset_hover_pending: dict[int, bool] = {}
+        self._preset_hover_after: Optional[str] = None
         for i in range(32):
             col = i % 8
             row = i // 8
             bx = sx + col * bs + 4
             by = preset_y + row * bs + 4
 
-            def make_preset_cb(idx: int):
-                def cb():
-                    self._select_preset(idx)
-                return cb
-
-            btn = MembraneButton(
-                self._main_canvas,
-                bx, by,
-                width=PRESET_BUTTON_SIZE,
-                height=PRESET_BUTTON_SIZE,
-                text=str(i + 1),
-                color=BUTTON_COLOR, active_color=BUTTON_ACTIVE,
-                command=make_preset_cb(i),
-                font=PRESET_NUM_FONT,
+            body = c.create_image(
+                bx, by, image=self._preset_face(BUTTON_COLOR),
+                anchor="nw", tags=("preset",),
             )
-            self._preset_buttons.append(btn)
+            text = c.create_text(
+                bx + size / 2, by + size / 2,
+                text=str(i + 1), font=_named_font(PRESET_NUM_FONT),
+                fill=BUTTON_TEXT,
+                anchor="center", state="disabled",
+            )
+            self._preset_body_ids.append(body)
+            self._preset_text_ids.append(text)
+            self._preset_item_index[body] = i
+
+        for sequence, handler in (
+            ("<Enter>", self._on_preset_enter),
+            ("<Leave>", self._on_preset_leave),
+            ("<ButtonPress-1>", self._on_preset_press),
+            ("<ButtonRelease-1>", self._on_preset_release),
+        ):
+            c.tag_bind("preset", sequence, c.register(handler))
 
         # Highlight the initially selected preset.
         self._highlight_preset(0)
@@ -790,10 +1561,7 @@ class VX7Panel(tk.Frame):
         sx = 370
         sy = 200
 
-        self._main_canvas.create_text(
-            sx, sy, text="FUNCTION", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="nw",
-        )
+        self._section_label(sx, sy, "FUNCTION", anchor="nw")
 
         bw = MEMBRANE_BUTTON_WIDTH + 2
         bh = MEMBRANE_BUTTON_HEIGHT + 2
@@ -802,14 +1570,12 @@ class VX7Panel(tk.Frame):
         # Background panel.
         func_panel_w = 3 * bw + 8
         func_panel_h = 2 * bh + 12
-        _rounded_rect(
-            self._main_canvas,
+        self._panel_background(
             sx - 4, func_y - 4,
             sx + func_panel_w, func_y + func_panel_h,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
         )
 
-        self._func_buttons: list[MembraneButton] = []
+        self._func_buttons: list[int] = []  # indices into self._buttons
 
         # Row 1: STORE, EDIT, COMPARE
         row1_names = ["STORE", "EDIT", "COMPARE"]
@@ -821,19 +1587,13 @@ class VX7Panel(tk.Frame):
             color = ACCENT_ORANGE if is_accent else ACCENT_BLUE
             active = ACCENT_ORANGE_ACTIVE if is_accent else ACCENT_BLUE_ACTIVE
 
-            def make_func_cb(func_name: str):
-                def cb():
-                    self._handle_function(func_name)
-                return cb
-
-            btn = MembraneButton(
-                self._main_canvas,
+            btn = self._buttons.add(
                 bx, by,
                 width=MEMBRANE_BUTTON_WIDTH,
                 height=MEMBRANE_BUTTON_HEIGHT,
                 text=name,
                 color=color, active_color=active,
-                command=make_func_cb(name),
+                command=functools.partial(self._handle_function, name),
                 font=BUTTON_FONT_SMALL,
                 text_color="#FFFFFF",
             )
@@ -849,19 +1609,13 @@ class VX7Panel(tk.Frame):
             color = ACCENT_ORANGE if is_accent else ACCENT_BLUE
             active = ACCENT_ORANGE_ACTIVE if is_accent else ACCENT_BLUE_ACTIVE
 
-            def make_func_cb2(func_name: str):
-                def cb():
-                    self._handle_function(func_name)
-                return cb
-
-            btn = MembraneButton(
-                self._main_canvas,
+            btn = self._buttons.add(
                 bx, by,
                 width=MEMBRANE_BUTTON_WIDTH,
                 height=MEMBRANE_BUTTON_HEIGHT,
                 text=name,
                 color=color, active_color=active,
-                command=make_func_cb2(name),
+                command=functools.partial(self._handle_function, name),
                 font=BUTTON_FONT_SMALL,
                 text_color="#FFFFFF",
             )
@@ -876,10 +1630,7 @@ class VX7Panel(tk.Frame):
         sx = 570
         sy = 200
 
-        self._main_canvas.create_text(
-            sx, sy, text="PARAMETERS", font=SECTION_FONT,
-            fill=SECTION_LABEL_COLOR, anchor="nw",
-        )
+        self._section_label(sx, sy, "PARAMETERS", anchor="nw")
 
         param_names = [
             "OUTPUT\nLEVEL", "FREQ\nCOARSE", "FREQ\nFINE",
@@ -895,35 +1646,25 @@ class VX7Panel(tk.Frame):
         panel_h = rows * bh + 8
 
         param_btn_y = sy + 14
-        _rounded_rect(
-            self._main_canvas,
+        self._panel_background(
             sx - 4, param_btn_y - 4,
             sx + panel_w, param_btn_y + panel_h,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
         )
 
-        self._param_buttons: list[MembraneButton] = []
+        self._param_buttons: list[int] = []  # indices into self._buttons
         for i, name in enumerate(param_names):
             col = i % cols
             row = i // cols
             bx = sx + col * bw + 4
             by = param_btn_y + row * bh + 4
 
-            def make_param_cb(param_name: str):
-                def cb():
-                    if self._on_param_change:
-                        self._on_param_change(param_name, None)
-                    self._lcd.set_line2(param_name.replace("\n", " "))
-                return cb
-
-            btn = MembraneButton(
-                self._main_canvas,
+            btn = self._buttons.add(
                 bx, by,
                 width=MEMBRANE_BUTTON_WIDTH,
                 height=MEMBRANE_BUTTON_HEIGHT,
                 text=name,
                 color=BUTTON_COLOR, active_color=BUTTON_ACTIVE,
-                command=make_param_cb(name),
+                command=functools.partial(self._select_parameter, name),
                 font=BUTTON_FONT_SMALL,
             )
             self._param_buttons.append(btn)
@@ -934,47 +1675,78 @@ class VX7Panel(tk.Frame):
 
     def _toggle_operator(self, index: int) -> None:
         """Toggle an operator on/off."""
-        self._operator_states[index] = not self._operator_states[index]
-        led_color = LED_ON if self._operator_states[index] else LED_OFF
-        glow = LED_GLOW if self._operator_states[index] else LED_OFF
-        self._main_canvas.itemconfigure(
-            self._op_leds[index], fill=led_color, outline=glow,
+        self._operator_mask ^= 1 << index
+        self._pending_op_paints.add(index)
+        self._schedule_visual_flush()
+        self._on_param_change(
+            f"op{index + 1}_enable",
+            bool(self._operator_mask >> index & 1),
         )
-        self.draw_algorithm(self._current_algo)
-        if self._on_param_change:
-            self._on_param_change(
-                f"op{index + 1}_enable",
-                self._operator_states[index],
+
+    def _paint_operators(self, indices: Iterable[int]) -> None:
+        """Repaint the LEDs and algorithm-diagram boxes of some operators.
+
+        Operators whose on-screen state is already current are skipped.
+        The rest are grouped by new state and each group is addressed with
+        one tag expression (e.g. ``opbox2||opbox5``) covering every cached
+        algorithm diagram, so a flush costs at most five canvas commands
+        however many operators changed.
+        """
+        groups: tuple[list[int], list[int]] = ([], [])  # (off, on)
+        mask = self._operator_mask
+        stale = mask ^ self._op_painted  # bits whose LED/boxes are out of date
+        for index in indices:
+            bit = 1 << index
+            if stale & bit:
+                self._op_painted ^= bit
+                groups[mask >> index & 1].append(index)
+        off, on = groups
+        c = self._main_canvas
+        if on:
+            leds = "||".join(f"op_led_{i}" for i in on)
+            boxes = "||".join(f"opbox{i + 1}" for i in on)
+            c.itemconfigure(
+                leds, image=_led_bitmap(OP_LED_RADIUS, LED_ON, LED_GLOW),
+            )
+            c.itemconfigure(f"({boxes})&&carrier", fill=OP_CARRIER_COLOR)
+            c.itemconfigure(f"({boxes})&&modulator", fill=OP_MODULATOR_COLOR)
+        if off:
+            leds = "||".join(f"op_led_{i}" for i in off)
+            boxes = "||".join(f"opbox{i + 1}" for i in off)
+            c.itemconfigure(
+                leds, image=_led_bitmap(OP_LED_RADIUS, LED_OFF, LED_OFF),
             )
+            c.itemconfigure(boxes, fill=OP_OFF_COLOR)
+
+    def _select_parameter(self, name: str) -> None:
+        """Handle a PARAMETERS button press."""
+        self._on_param_change(name, None)
+        self._lcd.set_line2(name.replace("\n", " "))
 
     def _handle_function(self, name: str) -> None:
-        """Dispatch function button presses."""
-        if name == "ALGO+":
-            new_algo = min(32, self._current_algo + 1)
-            self.draw_algorithm(new_algo)
-            self._lcd.set_line2(f"ALGORITHM {new_algo:>2d}")
-            if self._on_param_change:
-                self._on_param_change("algorithm", new_algo)
-        elif name == "ALGO-":
-            new_algo = max(1, self._current_algo - 1)
-            self.draw_algorithm(new_algo)
-            self._lcd.set_line2(f"ALGORITHM {new_algo:>2d}")
-            if self._on_param_change:
-                self._on_param_change("algorithm", new_algo)
-        elif name == "INIT":
-            self._lcd.set_line2("INIT VOICE")
-            self._lcd.flash()
-            if self._on_param_change:
-                self._on_param_change("init", True)
-        elif name == "STORE":
-            self._lcd.set_line2("STORE...")
-            self._lcd.flash(80)
+        """Dispatch function button presses.
+
+        ALGO+/ALGO- and INIT report their effect ("algorithm", "init");
+        the other buttons report a generic ``func_<name>`` parameter.
+        """
+        if name == "ALGO+" or name == "ALGO-":
+            step = _ALGO_NEXT if name == "ALGO+" else _ALGO_PREV
+            new_algo = step[self._current_algo]
+            self._schedule_algo_redraw(new_algo)
+            self._lcd.set_state(line2=f"ALGORITHM {new_algo:>2d}")
+            self._on_param_change("algorithm", new_algo)
+            return
+        if name == "INIT":
+            self._lcd.set_state(line2="INIT VOICE", flash_ms=120)
+            self._on_param_change("init", True)
+            return
+        if name == "STORE":
+            self._lcd.set_state(line2="STORE...", flash_ms=80)
         elif name == "EDIT":
-            self._lcd.set_line2("EDIT MODE")
+            self._lcd.set_state(line2="EDIT MODE")
         elif name == "COMPARE":
-            self._lcd.set_line2("COMPARE")
-        if self._on_param_change:
-            self._on_param_change(f"func_{name.lower()}", True)
+            self._lcd.set_state(line2="COMPARE")
+        self._on_param_change(f"func_{name.lower()}", True)
 
     # ------------------------------------------------------------------
     # Algorithm drawing
@@ -983,171 +1755,110 @@ class VX7Panel(tk.Frame):
     def draw_algorithm(self, algo_num: int) -> None:
         """Draw the operator connection topology for the given algorithm.
 
+        Each algorithm's diagram is rendered once into its own tagged item
+        group (``algo<N>``) on the main canvas; switching algorithms
+        only hides the previous group and shows the requested one.  Operator
+        on/off changes recolor the boxes of every cached group as they
+        happen (see ``_paint_operators``), so cached groups are shown as-is
+        and re-drawing the algorithm already on screen does nothing.
+
         Parameters
         ----------
         algo_num : int
             Algorithm number (1-32).
         """
+        if not 1 <= algo_num <= len(ALGORITHMS):
+            algo_num = 1
         self._current_algo = algo_num
-        c = self._algo_canvas
-        w = ALGO_DISPLAY_WIDTH
-        h = ALGO_DISPLAY_HEIGHT
-
-        # Clear previous drawing (except the number label).
-        c.delete("algo_drawing")
-
-        algo = ALGORITHMS.get(algo_num, ALGORITHMS[1])
-        connections = algo["connections"]
-        carriers = algo["carriers"]
-
-        # Compute operator positions.
-        # Carriers on bottom row, modulators stacked above.
-        op_positions: dict[int, tuple[float, float]] = {}
-        carrier_list = sorted(carriers)
-        modulator_list = sorted(set(range(1, 7)) - carriers)
-
-        # Bottom row: carriers, evenly spaced.
-        nc = len(carrier_list)
-        for i, op in enumerate(carrier_list):
-            x = (i + 0.5) / max(nc, 1) * (w - 30) + 15
-            y = h - 20
-            op_positions[op] = (x, y)
-
-        # Top row: modulators, evenly spaced.
-        nm = len(modulator_list)
-        for i, op in enumerate(modulator_list):
-            x = (i + 0.5) / max(nm, 1) * (w - 30) + 15
-            y = 26
-            op_positions[op] = (x, y)
+        if self._algo_shown == algo_num:
+            return
+        c = self._main_canvas
 
-        # Draw connections first (below the boxes).
-        for from_op, to_op in connections:
-            if from_op in op_positions and to_op in op_positions:
-                fx, fy = op_positions[from_op]
-                tx, ty = op_positions[to_op]
-                c.create_line(
-                    fx, fy, tx, ty,
-                    fill=ALGO_LINE_COLOR, width=1,
-                    arrow="last", arrowshape=(6, 7, 3),
-                    tags="algo_drawing",
-                )
+        if not self._algo_rendered[algo_num]:
+            self._render_algorithm(algo_num)
 
-        # Draw operator boxes.
-        box_r = 9
-        for op_num in range(1, 7):
-            if op_num not in op_positions:
-                continue
-            ox, oy = op_positions[op_num]
-            is_carrier = op_num in carriers
-            fill = OP_CARRIER_COLOR if is_carrier else OP_MODULATOR_COLOR
+        if self._algo_shown:
+            c.itemconfigure(f"algo{self._algo_shown}", state="hidden")
+        # Shown "disabled" so the diagram is never picked under the pointer.
+        c.itemconfigure(f"algo{algo_num}", state="disabled")
+        self._algo_shown = algo_num
 
-            if not self._operator_states[op_num - 1]:
-                fill = OP_OFF_COLOR
+        # Update the algorithm number.  It sits above the diagram area and
+        # nothing is drawn over it, so its stacking order needs no upkeep.
+        c.itemconfigure(self._algo_num_label, text=str(algo_num))
 
-            c.create_rectangle(
-                ox - box_r, oy - box_r, ox + box_r, oy + box_r,
-                fill=fill, outline=LABEL_COLOR, width=1,
-                tags="algo_drawing",
-            )
-            c.create_text(
-                ox, oy, text=str(op_num),
-                font=("Helvetica", 7, "bold"), fill="#FFFFFF",
-                tags="algo_drawing",
-            )
+    def _schedule_algo_redraw(self, algo_num: int) -> None:
+        """Make *algo_num* current and draw it within the next frame.
 
-        # Update the algorithm number (label lives on main_canvas, not algo_canvas).
-        self._main_canvas.itemconfigure(self._algo_num_label, text=str(algo_num))
-        self._main_canvas.tag_raise(self._algo_num_label)
+        Any number of changes before the redraw fires collapse into one
+        ``draw_algorithm`` call for the latest algorithm.
+        """
+        if not 1 <= algo_num <= len(ALGORITHMS):
+            algo_num = 1
+        self._current_algo = algo_num
+        if not self._algo_redraw_scheduled:
+            self._algo_redraw_scheduled = True
+            self.after(_FRAME_MS, self._flush_algo_redraw)
 
-    # ------------------------------------------------------------------
-    # Slider builder (shared by DATA ENTRY and MASTER sections)
-    # ------------------------------------------------------------------
+    def _flush_algo_redraw(self) -> None:
+        self._algo_redraw_scheduled = False
+        self.draw_algorithm(self._current_algo)
 
-    def _build_slider(
-        self, x: float, y: float, name: str, initial: float,
-    ) -> None:
-        """Draw a vertical slider on the main canvas."""
-        c = self._main_canvas
-        sw = SLIDER_WIDTH
-        sh = SLIDER_HEIGHT
+    def _algo_box_fill(self, op_num: int, is_carrier: bool) -> str:
+        """Fill color for an operator box in the algorithm diagram."""
+        if not self._operator_mask >> (op_num - 1) & 1:
+            return OP_OFF_COLOR
+        return OP_CARRIER_COLOR if is_carrier else OP_MODULATOR_COLOR
 
-        # Groove.
-        groove_x = x + sw // 2 - 2
-        c.create_rectangle(
-            groove_x, y, groove_x + 4, y + sh,
-            fill=SLIDER_GROOVE, outline=BORDER_COLOR,
-        )
+    def _render_algorithm(self, algo_num: int) -> None:
+        """Create the canvas items for one algorithm diagram (tag ``algo<N>``).
 
-        # Track fill.
-        fill_h = int(sh * (1 - initial))
-        fill_id = c.create_rectangle(
-            groove_x, y + fill_h, groove_x + 4, y + sh,
-            fill=SLIDER_FG, outline="",
-        )
-
-        # Handle.
-        handle_y = y + fill_h - SLIDER_HANDLE_HEIGHT // 2
-        handle = c.create_rectangle(
-            x + 2, handle_y,
-            x + sw - 2, handle_y + SLIDER_HANDLE_HEIGHT,
-            fill=SLIDER_FG, outline=LABEL_COLOR, width=1,
-        )
+        Coordinates in ``_ALGO_GEOMETRY`` are relative to the diagram area;
+        the finished group is moved to ``_algo_origin`` in one call.
+        """
+        c = self._main_canvas
+        group = f"algo{algo_num}"
+        lines, boxes = _ALGO_GEOMETRY[algo_num - 1]
 
-        # Handle grip lines.
-        for dy in range(-2, 4, 2):
+        # Draw connections first (below the boxes).
+        for coords in lines:
             c.create_line(
-                x + 6, handle_y + SLIDER_HANDLE_HEIGHT // 2 + dy,
-                x + sw - 6, handle_y + SLIDER_HANDLE_HEIGHT // 2 + dy,
-                fill=BUTTON_TEXT, width=1, tags=f"slider_grip_{name}",
+                *coords,
+                fill=ALGO_LINE_COLOR, width=1,
+                arrow="last", arrowshape=(6, 7, 3),
+                tags=(group,),
             )
 
-        # Drag interaction.
-        slider_data = {
-            "name": name, "fill_id": fill_id, "handle": handle,
-            "y_top": y, "y_bot": y + sh, "x": x, "sw": sw,
-        }
-
-        def on_press(event, data=slider_data):
-            data["dragging"] = True
-
-        def on_drag(event, data=slider_data):
-            if not data.get("dragging"):
-                return
-            # Clamp y.
-            ny = max(data["y_top"], min(data["y_bot"], event.y))
-            frac = 1.0 - (ny - data["y_top"]) / (data["y_bot"] - data["y_top"])
-            fill_h = int((data["y_bot"] - data["y_top"]) * (1 - frac))
-            fy = data["y_top"] + fill_h
-
-            c.coords(data["fill_id"],
-                     data["x"] + data["sw"] // 2 - 2, fy,
-                     data["x"] + data["sw"] // 2 + 2, data["y_bot"])
-            hy = fy - SLIDER_HANDLE_HEIGHT // 2
-            c.coords(data["handle"],
-                     data["x"] + 2, hy,
-                     data["x"] + data["sw"] - 2, hy + SLIDER_HANDLE_HEIGHT)
-
-            # Update grip lines.
-            c.delete(f"slider_grip_{data['name']}")
-            for dy in range(-2, 4, 2):
-                c.create_line(
-                    data["x"] + 6, hy + SLIDER_HANDLE_HEIGHT // 2 + dy,
-                    data["x"] + data["sw"] - 6, hy + SLIDER_HANDLE_HEIGHT // 2 + dy,
-                    fill=BUTTON_TEXT, width=1,
-                    tags=f"slider_grip_{data['name']}",
-                )
-
-            if data["name"] == "volume":
-                self._volume = frac
-            if self._on_param_change:
-                self._on_param_change(data["name"], frac)
+        # Draw operator boxes.  The opbox<N> and carrier/modulator tags let
+        # _paint_operators recolor one operator across all diagrams at once.
+        box_r = 9
+        for op_num, ox, oy, is_carrier in boxes:
+            c.create_rectangle(
+                ox - box_r, oy - box_r, ox + box_r, oy + box_r,
+                fill=self._algo_box_fill(op_num, is_carrier),
+                outline=LABEL_COLOR, width=1,
+                tags=(
+                    group, f"opbox{op_num}",
+                    "carrier" if is_carrier else "modulator",
+                ),
+            )
+            c.create_text(
+                ox, oy, text=str(op_num),
+                font=_named_font(("Helvetica", 7, "bold")), fill="#FFFFFF",
+                tags=(group,),
+            )
+        c.move(group, *self._algo_origin)
+        self._algo_rendered[algo_num] = 1
 
-        def on_release(event, data=slider_data):
-            data["dragging"] = False
+    # ------------------------------------------------------------------
+    # Slider changes (shared by DATA ENTRY and MASTER sections)
+    # ------------------------------------------------------------------
 
-        c.tag_bind(handle, "<ButtonPress-1>", on_press)
-        c.tag_bind(handle, "<B1-Motion>", on_drag)
-        c.tag_bind(handle, "<ButtonRelease-1>", on_release)
+    def _on_slider_change(self, name: str, value: float) -> None:
+        """Handle a slider being dragged to a new value."""
+        if name == "volume":
+            self._volume = value
+        self._on_param_change(name, value)
 
     # ------------------------------------------------------------------
     # Preset management
@@ -1165,10 +1876,79 @@ class VX7Panel(tk.Frame):
 
     def _highlight_preset(self, new: int, old: int | None = None) -> None:
         """Visually highlight the selected preset button."""
-        if old is not None and 0 <= old < len(self._preset_buttons):
-            self._preset_buttons[old].set_color(BUTTON_COLOR, BUTTON_ACTIVE)
-        if 0 <= new < len(self._preset_buttons):
-            self._preset_buttons[new].set_color(ACCENT_ORANGE, ACCENT_ORANGE_ACTIVE)
+        count = len(self._preset_body_ids)
+        if old is not None and 0 <= old < count:
+            self._set_preset_fill(old, BUTTON_COLOR)
+        if 0 <= new < count:
+            self._set_preset_fill(new, ACCENT_ORANGE)
+
+    def _preset_face(self, fill: str) -> tk.PhotoImage:
+        return _button_bitmap(
+            PRESET_BUTTON_SIZE, PRESET_BUTTON_SIZE, MEMBRANE_BUTTON_RADIUS, fill,
+        )
+
+    def _set_preset_fill(self, index: int, fill: str) -> None:
+        self._main_canvas.itemconfigure(
+            self._preset_body_ids[index], image=self._preset_face(fill),
+        )
+
+    def _preset_under_pointer(self) -> int:
+        """Index of the preset button under the pointer, or -1."""
+        current = self._main_canvas.find_withtag("current")
+        if not current:
+            return -1
+        return self._preset_item_index.get(current[0], -1)
+
+    def _paint_preset(self, index: int, hover: bool) -> None:
+        """Repaint a preset button in its resting or hover color."""
+        if index < 0:
+            return
+        if index == self._current_preset:
+            fill = ACCENT_ORANGE_ACTIVE if hover else ACCENT_ORANGE
+        else:
+            fill = BUTTON_ACTIVE if hover else BUTTON_COLOR
+        self._set_preset_fill(index, fill)
+
+    def _schedule_preset_hover(self, index: int, hover: bool) -> None:
+        """Queue a preset hover repaint for the next hover flush.
+
+        Sweeping the pointer across the grid only paints the final
+        state of each button, at most once per frame.
+        """
+        if index < 0:
+            return
+        self._preset_hover_pending[index] = hover
+        if self._preset_hover_after is None:
+            self._preset_hover_after = self.after(
+                _FRAME_MS, self._flush_preset_hover,
+            )
+
+    def _flush_preset_hover(self) -> None:
+        pending = self._preset_hover_pending
+        self._preset_hover_pending = {}
+        self._preset_hover_after = None
+        for index, hover in pending.items():
+            self._paint_preset(index, hover)
+
+    def _on_preset_enter(self) -> None:
+        self._schedule_preset_hover(self._preset_under_pointer(), hover=True)
+
+    def _on_preset_leave(self) -> None:
+        self._schedule_preset_hover(self._preset_under_pointer(), hover=False)
+
+    def _on_preset_press(self) -> None:
+        index = self._preset_under_pointer()
+        if index >= 0:
+            self._preset_hover_pending.pop(index, None)
+            self._set_preset_fill(index, BUTTON_PRESSED)
+
+    def _on_preset_release(self) -> None:
+        index = self._preset_under_pointer()
+        if index < 0:
+            return
+        self._preset_hover_pending.pop(index, None)
+        self._paint_preset(index, hover=False)
+        self._select_preset(index)
 
     def navigate_preset(self, delta: int) -> None:
         """Move to the next/previous preset (wraps around).
@@ -1193,10 +1973,18 @@ class VX7Panel(tk.Frame):
         )
         self._kb_canvas.pack(fill="x", side="bottom")
 
-        # Draw a thin border line at the top of the keyboard area.
-        self._kb_canvas.create_line(
-            0, 0, WINDOW_WIDTH, 0, fill=BORDER_COLOR, width=2,
+        # Static chrome (top border, wheel panel, tracks and marks) is
+        # painted into one image below everything else, as on the main
+        # canvas.
+        self._kb_bg_photo = tk.PhotoImage(
+            width=WINDOW_WIDTH, height=KEYBOARD_HEIGHT,
         )
+        self._kb_canvas.create_image(
+            0, 0, image=self._kb_bg_photo, anchor="nw",
+        )
+
+        # Thin border line at the top of the keyboard area.
+        self._kb_bg_photo.put(BORDER_COLOR, to=(0, 0, WINDOW_WIDTH, 1))
 
         # Build the wheels on the left side.
         self._build_wheels()
@@ -1211,11 +1999,15 @@ class VX7Panel(tk.Frame):
     def _build_wheels(self) -> None:
         """Draw pitch bend and modulation wheels on the left side of the keyboard."""
         c = self._kb_canvas
+        bg = self._kb_bg_photo
 
         # Wheel area background.
-        _rounded_rect(
-            c, 4, 4, WHEEL_AREA_WIDTH - 4, KEYBOARD_HEIGHT - 4,
-            radius=4, fill=GROUP_BG, outline=BORDER_COLOR,
+        _put_rounded_rect(
+            bg, 4, 4, WHEEL_AREA_WIDTH - 3, KEYBOARD_HEIGHT - 3, 4,
+            BORDER_COLOR,
+        )
+        _put_rounded_rect(
+            bg, 5, 5, WHEEL_AREA_WIDTH - 4, KEYBOARD_HEIGHT - 4, 3, GROUP_BG,
         )
 
         # --- Pitch Bend Wheel ---
@@ -1228,23 +2020,19 @@ class VX7Panel(tk.Frame):
         # Label.
         c.create_text(
             pb_x + pb_w // 2, pb_y - 4,
-            text="PITCH", font=("Helvetica", 6, "bold"),
+            text="PITCH", font=_named_font(("Helvetica", 6, "bold")),
             fill=LABEL_COLOR, anchor="s",
         )
 
         # Track (groove).
-        c.create_rectangle(
-            pb_x + pb_w // 2 - 3, pb_y,
-            pb_x + pb_w // 2 + 3, pb_y + track_h,
-            fill=WHEEL_TRACK, outline=BORDER_COLOR,
-        )
+        _put_track(bg, pb_x + pb_w // 2 - 3, pb_y, track_h)
 
-        # Center line marker.
+        # Center line marker, dashed 2 on / 2 off.
         center_y = pb_y + track_h // 2
-        c.create_line(
-            pb_x + 2, center_y, pb_x + pb_w - 2, center_y,
-            fill=BORDER_COLOR, width=1, dash=(2, 2),
+        dashes = " ".join(
+            BORDER_COLOR if dx % 4 < 2 else GROUP_BG for dx in range(pb_w - 4)
         )
+        bg.put("{" + dashes + "}", to=(pb_x + 2, center_y))
 
         # Wheel handle (starts at center for pitch bend).
         handle_h = 12
@@ -1262,13 +2050,12 @@ class VX7Panel(tk.Frame):
             fill=WHEEL_HIGHLIGHT, width=1,
         )
 
-        # Pitch bend drag data.
-        self._pb_data = {
-            "x": pb_x, "w": pb_w, "y_top": pb_y, "y_bot": pb_y + track_h,
-            "handle_h": handle_h, "center_y": center_y,
-            "dragging": False, "spring_back": True,
-            "current_y": handle_init_y,  # track handle top-y for move()
-        }
+        # Pitch bend drag state.
+        self._pb_data = WheelState(
+            y_top=pb_y, y_bot=pb_y + track_h, handle_h=handle_h,
+            current_y=handle_init_y, center_y=center_y, spring_back=True,
+            steps=16383,  # 14-bit, like MIDI pitch bend
+        )
 
         # Bind pitch bend events.
         c.tag_bind(self._pb_handle, "<ButtonPress-1>", self._pb_press)
@@ -1288,16 +2075,12 @@ class VX7Panel(tk.Frame):
         # Label.
         c.create_text(
             mod_x + mod_w // 2, mod_y - 4,
-            text="MOD", font=("Helvetica", 6, "bold"),
+            text="MOD", font=_named_font(("Helvetica", 6, "bold")),
             fill=LABEL_COLOR, anchor="s",
         )
 
         # Track (groove).
-        c.create_rectangle(
-            mod_x + mod_w // 2 - 3, mod_y,
-            mod_x + mod_w // 2 + 3, mod_y + mod_track_h,
-            fill=WHEEL_TRACK, outline=BORDER_COLOR,
-        )
+        _put_track(bg, mod_x + mod_w // 2 - 3, mod_y, mod_track_h)
 
         # Wheel handle (starts at bottom for mod wheel).
         mod_handle_h = 12
@@ -1315,13 +2098,11 @@ class VX7Panel(tk.Frame):
             fill=WHEEL_HIGHLIGHT, width=1,
         )
 
-        # Mod wheel drag data.
-        self._mod_data = {
-            "x": mod_x, "w": mod_w, "y_top": mod_y, "y_bot": mod_y + mod_track_h,
-            "handle_h": mod_handle_h,
-            "dragging": False, "spring_back": False,
-            "current_y": mod_handle_init_y,  # track handle top-y for move()
-        }
+        # Mod wheel drag state.
+        self._mod_data = WheelState(
+            y_top=mod_y, y_bot=mod_y + mod_track_h, handle_h=mod_handle_h,
+            current_y=mod_handle_init_y,
+        )
 
         # Bind mod wheel events.
         c.tag_bind(self._mod_handle, "<ButtonPress-1>", self._mod_press)
@@ -1332,100 +2113,122 @@ class VX7Panel(tk.Frame):
         c.tag_bind(self._mod_grip, "<ButtonRelease-1>", self._mod_release)
 
         # ---- Additional visual: scale markings on wheels ----
-        # Pitch bend scale marks.
-        for frac in (0.0, 0.25, 0.5, 0.75, 1.0):
-            mark_y = pb_y + int(track_h * frac)
-            c.create_line(
-                pb_x, mark_y, pb_x + 2, mark_y,
-                fill=LABEL_COLOR, width=1,
-            )
-
-        # Mod wheel scale marks.
-        for frac in (0.0, 0.25, 0.5, 0.75, 1.0):
-            mark_y = mod_y + int(mod_track_h * frac)
-            c.create_line(
-                mod_x, mark_y, mod_x + 2, mark_y,
-                fill=LABEL_COLOR, width=1,
-            )
+        _put_scale_marks(bg, pb_x, pb_y, track_h)
+        _put_scale_marks(bg, mod_x, mod_y, mod_track_h)
 
         # ---- Labels below wheels ----
         c.create_text(
             WHEEL_AREA_WIDTH // 2, KEYBOARD_HEIGHT - 8,
-            text="WHEELS", font=("Helvetica", 6),
+            text="WHEELS", font=_named_font(("Helvetica", 6)),
             fill=LABEL_COLOR, anchor="s",
         )
 
+    # Wheel motion is coalesced: drag events only record the pointer y and
+    # the handles are moved (and the new values reported) at most once
+    # per frame by _flush_wheels.
+
+    def _schedule_wheel_flush(self) -> None:
+        if not self._wheel_flush_scheduled:
+            self._wheel_flush_scheduled = True
+            self.after(_FRAME_MS, self._flush_wheels)
+
+    def _flush_wheels(self) -> None:
+        self._wheel_flush_scheduled = False
+        self._apply_pb_motion()
+        self._apply_mod_motion()
+
     def _pb_press(self, _event: tk.Event) -> None:
-        self._pb_data["dragging"] = True
+        self._pb_data.dragging = True
 
     def _pb_drag(self, event: tk.Event) -> None:
-        if not self._pb_data["dragging"]:
+        if not self._pb_data.dragging:
             return
+        self._pb_data.pending_y = event.y
+        self._schedule_wheel_flush()
+
+    def _apply_pb_motion(self) -> None:
         data = self._pb_data
-        c = self._kb_canvas
-        hh = data["handle_h"]
-        ny = max(data["y_top"], min(data["y_bot"] - hh, event.y - hh // 2))
+        y = data.pending_y
+        if y is None:
+            return
+        data.pending_y = None
+        y_top = data.y_top
+        y_max = data.y_max
+        ny = data.clamp(y)
 
         # Move handle and grip by delta (preserves the rounded polygon shape).
-        dy = ny - data["current_y"]
+        dy = ny - data.current_y
         if dy != 0:
+            c = self._kb_canvas
             c.move(self._pb_handle, 0, dy)
             c.move(self._pb_grip, 0, dy)
-            data["current_y"] = ny
+            data.current_y = ny
 
         # Calculate pitch bend value (0.0=bottom, 1.0=top, 0.5=center).
-        total_range = data["y_bot"] - hh - data["y_top"]
+        total_range = y_max - y_top
         if total_range > 0:
-            self._pitch_bend = 1.0 - (ny - data["y_top"]) / total_range
-        if self._on_param_change:
+            self._pitch_bend = 1.0 - (ny - y_top) / total_range
+        if data.needs_report(self._pitch_bend):
             self._on_param_change("pitch_bend", self._pitch_bend)
 
     def _pb_release(self, _event: tk.Event) -> None:
-        self._pb_data["dragging"] = False
-        if self._pb_data["spring_back"]:
-            # Spring back to center.
+        self._pb_data.dragging = False
+        if self._pb_data.spring_back:
+            # Spring back to center (any queued motion is superseded).
             data = self._pb_data
-            c = self._kb_canvas
-            hh = data["handle_h"]
-            target_y = data["center_y"] - hh // 2
-
-            dy = target_y - data["current_y"]
+            data.pending_y = None
+            dy = data.center_top - data.current_y
             if dy != 0:
+                c = self._kb_canvas
                 c.move(self._pb_handle, 0, dy)
                 c.move(self._pb_grip, 0, dy)
-                data["current_y"] = target_y
+                data.current_y = data.center_top
 
             self._pitch_bend = 0.5
-            if self._on_param_change:
+            if data.needs_report(0.5):
                 self._on_param_change("pitch_bend", 0.5)
+        else:
+            self._apply_pb_motion()
 
     def _mod_press(self, _event: tk.Event) -> None:
-        self._mod_data["dragging"] = True
+        self._mod_data.dragging = True
 
     def _mod_drag(self, event: tk.Event) -> None:
-        if not self._mod_data["dragging"]:
+        if not self._mod_data.dragging:
             return
+        self._mod_data.pending_y = event.y
+        self._schedule_wheel_flush()
+
+    def _apply_mod_motion(self) -> None:
         data = self._mod_data
-        c = self._kb_canvas
-        hh = data["handle_h"]
-        ny = max(data["y_top"], min(data["y_bot"] - hh, event.y - hh // 2))
+        y = data.pending_y
+        if y is None:
+            return
+        data.pending_y = None
+        y_top = data.y_top
+        y_max = data.y_max
+        ny = data.clamp(y)
 
         # Move handle and grip by delta (preserves the rounded polygon shape).
-        dy = ny - data["current_y"]
+        dy = ny - data.current_y
         if dy != 0:
+            c = self._kb_canvas
             c.move(self._mod_handle, 0, dy)
             c.move(self._mod_grip, 0, dy)
-            data["current_y"] = ny
+            data.current_y = ny
 
         # Calculate mod value (0.0=bottom, 1.0=top).
-        total_range = data["y_bot"] - hh - data["y_top"]
+        total_range = y_max - y_top
         if total_range > 0:
-            self._mod_wheel = 1.0 - (ny - data["y_top"]) / total_range
-        if self._on_param_change:
+            self._mod_wheel = 1.0 - (ny - y_top) / total_range
+        if data.needs_report(self._mod_wheel):
             self._on_param_change("mod_wheel", self._mod_wheel)
 
     def _mod_release(self, _event: tk.Event) -> None:
-        self._mod_data["dragging"] = False
+        self._mod_data.dragging = False
+        # Apply the last queued position now so the reported value
+        # matches where the handle was let go.
+        self._apply_mod_motion()
         # Mod wheel does NOT spring back -- stays where you leave it.
 
     # ------------------------------------------------------------------
@@ -1433,24 +2236,22 @@ class VX7Panel(tk.Frame):
     # ------------------------------------------------------------------
 
     def _build_piano_keys(self) -> None:
-        """Build the 5-octave clickable piano keyboard (C1-C6 = MIDI 36-96)."""
+        """Build the 5-octave clickable piano keyboard (C1-C6 = MIDI 36-96).
+
+        All keys are painted into a single PhotoImage shown by one canvas
+        item.  Pressing a key repaints just that key's visible pixels; a
+        canvas-level binding maps the click position back to a note.
+        """
         c = self._kb_canvas
 
         # The keyboard spans C1 (MIDI 36) to C6 (MIDI 96) = 5 octaves + 1.
         self._midi_start = 36  # C1 (MIDI 36)
         self._midi_end = 96    # C6 (MIDI 96)
 
-        # Map MIDI note -> is_black.
-        self._black_pattern = {1, 3, 6, 8, 10}
-
         # Determine white keys in range.
-        white_notes: list[int] = []
-        black_notes: list[int] = []
-        for midi_note in range(self._midi_start, self._midi_end + 1):
-            if (midi_note % 12) in self._black_pattern:
-                black_notes.append(midi_note)
-            else:
-                white_notes.append(midi_note)
+        notes = range(self._midi_start, self._midi_end + 1)
+        white_notes = [n for n in notes if not _IS_BLACK[n]]
+        black_notes = [n for n in notes if _IS_BLACK[n]]
 
         self._white_notes = white_notes
         self._black_notes = black_notes
@@ -1465,96 +2266,210 @@ class VX7Panel(tk.Frame):
         x_offset = WHEEL_AREA_WIDTH + (available_width - total_kb_width) // 2
         y_offset = 4
 
-        # Draw white keys first.
-        self._key_rects: dict[int, int] = {}
-        self._key_colors: dict[int, str] = {}
-
-        for i, note in enumerate(white_notes):
-            x0 = x_offset + i * kw
-            y0 = y_offset
-            x1 = x0 + kw - 1
-            y1 = y0 + kh
-
-            rect = c.create_rectangle(
-                x0, y0, x1, y1,
-                fill=WHITE_KEY, outline=KEY_BORDER, width=1,
-            )
-            self._key_rects[note] = rect
-            self._key_colors[note] = WHITE_KEY
-
-            # Note name label at bottom of key (C notes only).
-            white_idx = [0, 2, 4, 5, 7, 9, 11]
-            semi = note % 12
-            if semi == 0:  # C note
-                octave = (note // 12) - 1
-                c.create_text(
-                    x0 + kw // 2, y1 - 10,
-                    text=f"C{octave}", font=KEY_LABEL_FONT,
-                    fill="#999999",
-                )
-
-        # Draw black keys on top.
-        white_midi = {n: i for i, n in enumerate(white_notes)}
-
-        black_to_left_white = {
-            1: 0, 3: 2, 6: 5, 8: 7, 10: 9,
-        }
-
+        # Rebuilding with unchanged geometry is a no-op; otherwise the
+        # previous image and labels are replaced.
+        geometry = (x_offset, y_offset, kw, num_white)
+        if geometry == self._kb_geometry:
+            return
+        self._kb_geometry = geometry
+        c.delete("piano")
+        self._kb_x_offset = x_offset
+
+        # Key outlines as (x0, y0, x1, y1) with inclusive corners, the same
+        # coordinates the keys used as canvas rectangles.
+        white_x0 = [x_offset + i * kw for i in range(num_white)]
+        white_idx = {n: i for i, n in enumerate(white_notes)}
         bkw = BLACK_KEY_WIDTH
         bkh = BLACK_KEY_HEIGHT
-
+        black_boxes: dict[int, KeyBox] = {}
         for note in black_notes:
-            semi = note % 12
-            left_white_semi = black_to_left_white[semi]
-            left_white_note = (note // 12) * 12 + left_white_semi
-            if left_white_note not in white_midi:
+            left_white_note = note - 1  # every black key sits right of a white
+            if left_white_note not in white_idx:
                 continue
-            wi = white_midi[left_white_note]
-            cx = x_offset + (wi + 1) * kw
+            cx = x_offset + (white_idx[left_white_note] + 1) * kw
             x0 = cx - bkw // 2
-            y0 = y_offset
-            x1 = x0 + bkw
-            y1 = y0 + bkh
-
-            rect = c.create_rectangle(
-                x0, y0, x1, y1,
-                fill=BLACK_KEY, outline="#000000", width=1,
+            black_boxes[note] = (x0, y_offset, x0 + bkw, y_offset + bkh)
+
+        # Paint the static keyboard.  Every pixel row of the keyboard is
+        # one of a handful of patterns, so each pattern is built once as a
+        # row of colours and Tk tiles it down its band of rows: seven
+        # ``put`` calls instead of several per key.
+        photo = tk.PhotoImage(width=WINDOW_WIDTH, height=KEYBOARD_HEIGHT)
+        self._kb_photo = photo
+        y1 = y_offset + kh
+        span = total_kb_width
+        white_row = [
+            KEY_BORDER if dx % kw in (0, kw - 1) else WHITE_KEY
+            for dx in range(span)
+        ]
+        top_row = [KEY_BORDER] * span
+        black_row = list(white_row)
+        highlight_row = list(white_row)
+        bottom_row = list(white_row)
+        for x0, _y0, x1, _by1 in black_boxes.values():
+            dx0, dx1 = x0 - x_offset, x1 - x_offset
+            top_row[dx0:dx1 + 1] = ["#000000"] * (dx1 - dx0 + 1)
+            bottom_row[dx0:dx1 + 1] = ["#000000"] * (dx1 - dx0 + 1)
+            black_row[dx0:dx1 + 1] = (
+                ["#000000"] + [BLACK_KEY] * (dx1 - dx0 - 1) + ["#000000"]
             )
             # Subtle highlight at top of black key.
-            c.create_line(
-                x0 + 2, y0 + 2, x1 - 2, y0 + 2,
-                fill="#3A3530", width=1,
+            highlight_row[dx0:dx1 + 1] = (
+                ["#000000", BLACK_KEY] + ["#3A3530"] * (dx1 - dx0 - 3)
+                + [BLACK_KEY, "#000000"]
             )
-            self._key_rects[note] = rect
-            self._key_colors[note] = BLACK_KEY
-
-        # Bind mouse events for all keys.
-        for note, rect in self._key_rects.items():
-            c.tag_bind(
-                rect, "<ButtonPress-1>",
-                lambda e, n=note: self._key_press(n),
+        black_bottom = y_offset + bkh
+        for row, ya, yb in (
+            (top_row, y_offset, y_offset + 1),
+            (black_row, y_offset + 1, y_offset + 2),
+            (highlight_row, y_offset + 2, y_offset + 3),
+            (black_row, y_offset + 3, black_bottom),
+            (bottom_row, black_bottom, black_bottom + 1),
+            (white_row, black_bottom + 1, y1),
+            ([KEY_BORDER] * span, y1, y1 + 1),
+        ):
+            photo.put(
+                "{" + " ".join(row) + "}", to=(x_offset, ya, x_offset + span, yb)
             )
-            c.tag_bind(
-                rect, "<ButtonRelease-1>",
-                lambda e, n=note: self._key_release(n),
+        c.create_image(0, 0, image=photo, anchor="nw", tags=("piano",))
+
+        # The fresh image shows every key released; repaint held keys.
+        self._key_painted = bytearray(128)
+        held = self._pressed_mask
+        while held:
+            low = held & -held
+            self._pending_key_paints[low.bit_length() - 1] = True
+            held ^= low
+        if self._pressed_mask:
+            self._schedule_visual_flush()
+
+        # Visible interior of every key as PhotoImage regions, indexed by
+        # note - midi_start: a white key loses the strips covered by its
+        # black neighbours.  Black keys also keep their highlight strip.
+        self._kb_y_range = (y_offset, y1, black_bottom)  # top, bottom, black
+        key_regions: list[tuple[KeyBox, ...]] = [()] * len(notes)
+        key_highlight: list[Optional[KeyBox]] = [None] * len(notes)
+        start = self._midi_start
+        for note, x0 in zip(white_notes, white_x0):
+            left, right = x0 + 1, x0 + kw - 1
+            if note - 1 in black_boxes:
+                left = black_boxes[note - 1][2] + 1
+            if note + 1 in black_boxes:
+                right = black_boxes[note + 1][0]
+            key_regions[note - start] = (
+                (left, y_offset + 1, right, black_bottom + 1),
+                (x0 + 1, black_bottom + 1, x0 + kw - 1, y1),
             )
+        for note, (x0, y0, x1, by1) in black_boxes.items():
+            key_regions[note - start] = ((x0 + 1, y0 + 1, x1, by1),)
+            key_highlight[note - start] = (x0 + 2, y0 + 2, x1 - 1, y0 + 3)
+
+        # Released / pressed "sprite" of every key: the (colour, region)
+        # puts that draw its face, built once so a key change just replays
+        # one of two prepared tuples.
+        self._key_sprites: list[tuple[KeySprite, KeySprite]] = []
+        for k, note in enumerate(notes):
+            if _IS_BLACK[note]:
+                fills = (BLACK_KEY, BLACK_KEY_PRESSED)
+            else:
+                fills = (WHITE_KEY, WHITE_KEY_PRESSED)
+            sprites: list[KeySprite] = []
+            for fill in fills:
+                ops = [(fill, box) for box in key_regions[k]]
+                highlight = key_highlight[k]
+                if highlight is not None and fill != "#3A3530":
+                    ops.append(("#3A3530", highlight))
+                sprites.append(tuple(ops))
+            self._key_sprites.append((sprites[0], sprites[1]))
+
+        # Hit-test table: the note under every column (x - x_offset) of the
+        # upper key area, where black keys sit on top of the whites,
+        # followed by the same for the lower area (white keys only).
+        lower = bytearray(total_kb_width)
+        for note, x0 in zip(white_notes, white_x0):
+            dx = x0 - x_offset
+            lower[dx:dx + kw] = bytes((note,)) * kw
+        upper = bytearray(lower)
+        for note, (x0, _y0, x1, _y1) in black_boxes.items():
+            dx0 = max(0, x0 - x_offset)
+            dx1 = min(total_kb_width, x1 + 1 - x_offset)
+            upper[dx0:dx1] = bytes((note,)) * (dx1 - dx0)
+        self._kb_width = total_kb_width
+        self._x_to_note = bytes(upper + lower)
+
+        # Note name label at bottom of key (C notes only).
+        for note, x0 in zip(white_notes, white_x0):
+            if note % 12 == 0:
+                c.create_text(
+                    x0 + kw // 2, y1 - 10,
+                    text=_C_LABELS[note // 12],
+                    font=_named_font(KEY_LABEL_FONT),
+                    fill="#999999", state="disabled", tags=("piano",),
+                )
 
+        # One pair of canvas-level bindings serves every key.
+        c.bind("<ButtonPress-1>", self._on_kb_press)
         # Also handle mouse leaving the keyboard while pressed.
         c.bind("<ButtonRelease-1>", self._key_release_all)
 
+    def _note_at(self, x: int, y: int) -> int:
+        """MIDI note of the key at canvas position (*x*, *y*), or -1."""
+        top, bottom, black_bottom = self._kb_y_range
+        dx = x - self._kb_x_offset
+        width = self._kb_width
+        if not (top <= y <= bottom and 0 <= dx < width):
+            return -1
+        return self._x_to_note[dx if y <= black_bottom else width + dx]
+
+    def _on_kb_press(self, event: tk.Event) -> None:
+        note = self._note_at(event.x, event.y)
+        if note >= 0:
+            self._key_press(note)
+
+    def _paint_key(self, note: int, pressed: bool) -> None:
+        """Repaint the visible face of one key in the keyboard image."""
+        k = note - self._midi_start
+        if not 0 <= k < len(self._key_sprites):
+            return
+        if self._key_painted[note] == pressed:
+            return
+        self._key_painted[note] = pressed
+        put = self._kb_photo.put
+        for color, box in self._key_sprites[k][pressed]:
+            put(color, to=box)
+
+    def _schedule_visual_flush(self) -> None:
+        """Arrange for queued key/operator repaints to run on the next idle."""
+        if not self._visual_flush_scheduled:
+            self._visual_flush_scheduled = True
+            self.after_idle(self._flush_visuals)
+
+    def _flush_visuals(self) -> None:
+        """Apply the latest queued state of every dirty key and operator.
+
+        A key pressed and released within one burst of events is painted
+        once, in its final state.
+        """
+        self._visual_flush_scheduled = False
+        keys = self._pending_key_paints
+        ops = self._pending_op_paints
+        self._pending_key_paints = {}
+        self._pending_op_paints = set()
+        for note, pressed in keys.items():
+            self._paint_key(note, pressed)
+        if ops:
+            self._paint_operators(ops)
+
     def _key_press(self, note: int) -> None:
         """Handle mouse-down on a piano key."""
-        if note in self._pressed_keys:
+        bit = 1 << note
+        if self._pressed_mask & bit:
             return
-        self._pressed_keys.add(note)
+        self._pressed_mask |= bit
 
         # Visual depress.
-        is_black = (note % 12) in self._black_pattern
-        pressed_color = BLACK_KEY_PRESSED if is_black else WHITE_KEY_PRESSED
-        if note in self._key_rects:
-            self._kb_canvas.itemconfigure(
-                self._key_rects[note], fill=pressed_color,
-            )
+        self._pending_key_paints[note] = True
+        self._schedule_visual_flush()
 
         # Callback.
         velocity = 100
@@ -1563,15 +2478,14 @@ class VX7Panel(tk.Frame):
 
     def _key_release(self, note: int) -> None:
         """Handle mouse-up on a piano key."""
-        if note not in self._pressed_keys:
+        bit = 1 << note
+        if not self._pressed_mask & bit:
             return
-        self._pressed_keys.discard(note)
+        self._pressed_mask ^= bit
 
         # Visual restore.
-        if note in self._key_rects and note in self._key_colors:
-            self._kb_canvas.itemconfigure(
-                self._key_rects[note], fill=self._key_colors[note],
-            )
+        self._pending_key_paints[note] = False
+        self._schedule_visual_flush()
 
         # Callback.
         if self._on_note_off:
@@ -1579,21 +2493,23 @@ class VX7Panel(tk.Frame):
 
     def _key_release_all(self, _event: tk.Event) -> None:
         """Release all pressed keys (mouse left the keyboard area)."""
-        for note in list(self._pressed_keys):
-            self._key_release(note)
+        pressed = self._pressed_mask
+        while pressed:
+            low = pressed & -pressed
+            self._key_release(low.bit_length() - 1)
+            pressed ^= low
 
     # ==================================================================
     # Public API for external updates
     # ==================================================================
 
     def update_display(self, line1: str, line2: str) -> None:
-        """Update both LCD lines."""
-        self._lcd.set_line1(line1)
-        self._lcd.set_line2(line2)
+        """Update both LCD lines (applied on the next idle cycle)."""
+        self._lcd.set_state(line1=line1, line2=line2)
 
     def update_display_line2(self, text: str) -> None:
-        """Update only the bottom LCD line."""
-        self._lcd.set_line2(text)
+        """Update only the bottom LCD line (applied on the next idle cycle)."""
+        self._lcd.set_state(line2=text)
 
     def update_preset(self, index: int, name: str) -> None:
         """Update the display to show the selected preset."""
@@ -1605,20 +2521,27 @@ class VX7Panel(tk.Frame):
         self.set_patch_number(index + 1)
 
     def update_algorithm(self, algo_num: int) -> None:
-        """Redraw the algorithm display."""
-        self.draw_algorithm(algo_num)
+        """Redraw the algorithm display (on the next frame)."""
+        self._schedule_algo_redraw(algo_num)
 
     def set_operator_state(self, op_index: int, enabled: bool) -> None:
-        """Set a specific operator on/off (0-indexed)."""
+        """Set a specific operator on/off (0-indexed).
+
+        Setting an operator to the state it already has does nothing;
+        otherwise its LED and diagram boxes are repainted on the next idle
+        flush together with any other operator changes.
+        """
         if 0 <= op_index < 6:
-            self._operator_states[op_index] = enabled
-            led_color = LED_ON if enabled else LED_OFF
-            glow = LED_GLOW if enabled else LED_OFF
-            self._main_canvas.itemconfigure(
-                self._op_leds[op_index], fill=led_color, outline=glow,
-            )
+            bit = 1 << op_index
+            if bool(self._operator_mask & bit) == bool(enabled):
+                return
+            if enabled:
+                self._operator_mask |= bit
+            else:
+                self._operator_mask &= ~bit
+            self._pending_op_paints.add(op_index)
+            self._schedule_visual_flush()
             self._op_buttons[op_index].state = enabled
-            self.draw_algorithm(self._current_algo)
 
     def get_volume(self) -> float:
         """Return the current master volume (0.0 - 1.0)."""
@@ -162,48 +162,50 @@ BUTTON_GAP = 4
 # ---------------------------------------------------------------------------
 # DX7 Algorithm definitions (operator connection topologies)
 # ---------------------------------------------------------------------------
-# Each algorithm is a list of connections and carriers.
-# Format: dict with 'connections' (list of (from_op, to_op) tuples)
-# and 'carriers' (set of operator numbers that output to the DAC).
-# Operators are numbered 1-6.
+# Each algorithm is a ``(connections, carriers)`` pair of tuples:
+# 'connections' holds (from_op, to_op) edges and 'carriers' lists the
+# operators that output to the DAC.  Operators are numbered 1-6.
+#
+# The table is a tuple indexed by ``algorithm - 1`` (0-31) so lookups are
+# plain tuple subscripts on immutable data.
 #
 # These 32 algorithms match the real DX7.
 # ---------------------------------------------------------------------------
 
-ALGORITHMS = {
-    1:  {"connections": [(2, 1), (4, 3), (6, 5), (3, 1)], "carriers": {1}},
-    2:  {"connections": [(2, 1), (4, 3), (6, 5), (3, 1)], "carriers": {1}},
-    3:  {"connections": [(2, 1), (3, 1), (5, 4), (6, 4)], "carriers": {1, 4}},
-    4:  {"connections": [(2, 1), (3, 1), (5, 4), (6, 5)], "carriers": {1, 4}},
-    5:  {"connections": [(2, 1), (4, 3), (6, 5)], "carriers": {1, 3, 5}},
-    6:  {"connections": [(2, 1), (4, 3), (6, 5)], "carriers": {1, 3, 5}},
-    7:  {"connections": [(2, 1), (4, 3), (5, 3), (6, 5)], "carriers": {1, 3}},
-    8:  {"connections": [(2, 1), (4, 3), (6, 5), (5, 3)], "carriers": {1, 3}},
-    9:  {"connections": [(2, 1), (3, 1), (5, 4), (6, 4)], "carriers": {1, 4}},
-    10: {"connections": [(2, 1), (4, 3), (5, 3), (6, 3)], "carriers": {1, 3}},
-    11: {"connections": [(2, 1), (4, 3), (6, 5), (5, 3)], "carriers": {1, 3}},
-    12: {"connections": [(2, 1), (3, 1), (4, 1), (6, 5)], "carriers": {1, 5}},
-    13: {"connections": [(2, 1), (4, 3), (5, 3), (6, 3)], "carriers": {1, 3}},
-    14: {"connections": [(2, 1), (4, 3), (5, 3), (6, 5)], "carriers": {1, 3}},
-    15: {"connections": [(2, 1), (4, 3), (5, 3)], "carriers": {1, 3}},
-    16: {"connections": [(2, 1), (3, 1), (5, 4), (6, 5), (4, 1)], "carriers": {1}},
-    17: {"connections": [(2, 1), (3, 1), (5, 4), (4, 1)], "carriers": {1}},
-    18: {"connections": [(2, 1), (3, 1), (4, 1), (6, 5)], "carriers": {1, 5}},
-    19: {"connections": [(2, 1), (4, 3), (5, 3), (6, 3)], "carriers": {1, 3}},
-    20: {"connections": [(2, 1), (3, 1), (5, 4), (6, 4)], "carriers": {1, 4}},
-    21: {"connections": [(2, 1), (3, 1), (5, 4), (6, 4)], "carriers": {1, 4}},
-    22: {"connections": [(2, 1), (4, 3), (5, 3), (6, 3)], "carriers": {1, 3}},
-    23: {"connections": [(2, 1), (4, 3), (5, 3)], "carriers": {1, 3}},
-    24: {"connections": [(2, 1), (4, 3), (5, 3)], "carriers": {1, 3}},
-    25: {"connections": [(2, 1), (4, 3)], "carriers": {1, 3}},
-    26: {"connections": [(2, 1), (4, 3), (5, 3)], "carriers": {1, 3}},
-    27: {"connections": [(2, 1), (4, 3)], "carriers": {1, 3}},
-    28: {"connections": [(3, 2), (5, 4), (6, 5)], "carriers": {1, 2, 4}},
-    29: {"connections": [(2, 1), (5, 4), (6, 5)], "carriers": {1, 4}},
-    30: {"connections": [(3, 2), (5, 4)], "carriers": {1, 2, 4}},
-    31: {"connections": [(2, 1)], "carriers": {1, 3, 4, 5}},
-    32: {"connections": [], "carriers": {1, 2, 3, 4, 5, 6}},
-}
+ALGORITHMS = (
+    (((2, 1), (4, 3), (6, 5), (3, 1)), (1,)),                   # 1
+    (((2, 1), (4, 3), (6, 5), (3, 1)), (1,)),                   # 2
+    (((2, 1), (3, 1), (5, 4), (6, 4)), (1, 4)),                 # 3
+    (((2, 1), (3, 1), (5, 4), (6, 5)), (1, 4)),                 # 4
+    (((2, 1), (4, 3), (6, 5)), (1, 3, 5)),                      # 5
+    (((2, 1), (4, 3), (6, 5)), (1, 3, 5)),                      # 6
+    (((2, 1), (4, 3), (5, 3), (6, 5)), (1, 3)),                 # 7
+    (((2, 1), (4, 3), (6, 5), (5, 3)), (1, 3)),                 # 8
+    (((2, 1), (3, 1), (5, 4), (6, 4)), (1, 4)),                 # 9
+    (((2, 1), (4, 3), (5, 3), (6, 3)), (1, 3)),                 # 10
+    (((2, 1), (4, 3), (6, 5), (5, 3)), (1, 3)),                 # 11
+    (((2, 1), (3, 1), (4, 1), (6, 5)), (1, 5)),                 # 12
+    (((2, 1), (4, 3), (5, 3), (6, 3)), (1, 3)),                 # 13
+    (((2, 1), (4, 3), (5, 3), (6, 5)), (1, 3)),                 # 14
+    (((2, 1), (4, 3), (5, 3)), (1, 3)),                         # 15
+    (((2, 1), (3, 1), (5, 4), (6, 5), (4, 1)), (1,)),           # 16
+    (((2, 1), (3, 1), (5, 4), (4, 1)), (1,)),                   # 17
+    (((2, 1), (3, 1), (4, 1), (6, 5)), (1, 5)),                 # 18
+    (((2, 1), (4, 3), (5, 3), (6, 3)), (1, 3)),                 # 19
+    (((2, 1), (3, 1), (5, 4), (6, 4)), (1, 4)),                 # 20
+    (((2, 1), (3, 1), (5, 4), (6, 4)), (1, 4)),                 # 21
+    (((2, 1), (4, 3), (5, 3), (6, 3)), (1, 3)),                 # 22
+    (((2, 1), (4, 3), (5, 3)), (1, 3)),                         # 23
+    (((2, 1), (4, 3), (5, 3)), (1, 3)),                         # 24
+    (((2, 1), (4, 3)), (1, 3)),                                 # 25
+    (((2, 1), (4, 3), (5, 3)), (1, 3)),                         # 26
+    (((2, 1), (4, 3)), (1, 3)),                                 # 27
+    (((3, 2), (5, 4), (6, 5)), (1, 2, 4)),                      # 28
+    (((2, 1), (5, 4), (6, 5)), (1, 4)),                         # 29
+    (((3, 2), (5, 4)), (1, 2, 4)),                              # 30
+    (((2, 1),), (1, 3, 4, 5)),                                  # 31
+    ((), (1, 2, 3, 4, 5, 6)),                                   # 32
+)
 
 # ---------------------------------------------------------------------------
 # DX7 operator layout positions for algorithm diagrams
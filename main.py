@@ -9,11 +9,13 @@ the audio output, and the optional MIDI handler.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import sys
-import threading
 from typing import Any
 
 from engine.synth import Synth
+from engine.voice import VoicePatch
 from audio.output import AudioEngine
 from midi.handler import MidiHandler
 from gui.app import VX7App
@@ -89,6 +91,18 @@ def convert_preset(factory_preset: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+@functools.cache
+def _all_converted() -> tuple[VoicePatch, ...]:
+    """All factory presets as parsed patches, converted once per process.
+
+    Patches are immutable and shared; per-session edits (such as a changed
+    algorithm) are kept by the controller and applied to a copy.
+    """
+    return tuple(
+        VoicePatch.from_preset(convert_preset(p)) for p in FACTORY_PRESETS
+    )
+
+
 # ======================================================================
 # Application controller
 # ======================================================================
@@ -113,9 +127,9 @@ class VX7Controller:
         # --- State ---
         self._current_preset_index: int = 0
         self._preset_names: list[str] = get_preset_names()
-        self._converted_presets: list[dict[str, Any]] = [
-            convert_preset(p) for p in FACTORY_PRESETS
-        ]
+        self._patches = _all_converted()
+        # Algorithm of each preset (0-based), changed by ALGO+/-.
+        self._algorithms: list[int] = [p.algorithm for p in self._patches]
 
         # --- Wire everything ---
         self._setup_callbacks()
@@ -132,10 +146,8 @@ class VX7Controller:
         self.gui.set_preset_callback(self._on_preset_select)
         self.gui.set_param_callback(self._on_param_change)
 
-        # MIDI callbacks (thread-safe: synth.note_on/off are safe to call
-        # from any thread since they only touch voice state that is read
-        # during the audio callback's render() — Python's GIL serialises
-        # these accesses).
+        # MIDI callbacks (thread-safe: notes are only queued here and are
+        # applied by the audio callback's render()).
         if self.midi.available:
             self.midi.set_callbacks(
                 note_on=self._on_note_on,
@@ -154,11 +166,15 @@ class VX7Controller:
     # Callbacks
     # ------------------------------------------------------------------
 
+    # Notes, presets and controller changes all go to the synth's single
+    # event queue, which the audio callback drains in order at the start
+    # of each block.
+
     def _on_note_on(self, note: int, velocity: int) -> None:
-        self.synth.note_on(note, velocity)
+        self.synth.queue_note_on(note, velocity)
 
     def _on_note_off(self, note: int) -> None:
-        self.synth.note_off(note)
+        self.synth.queue_note_off(note)
 
     def _on_preset_select(self, index: int) -> None:
         self._load_preset(index)
@@ -169,10 +185,10 @@ class VX7Controller:
             self.audio.volume = vol
         elif param == "pitch_bend":
             # value is 0.0-1.0 (0.5 = center)
-            self.synth.set_pitch_bend(float(value))
+            self.synth.queue_pitch_bend(float(value))
         elif param == "mod_wheel":
             # value is 0.0-1.0 (0.0 = off)
-            self.synth.set_mod_wheel(float(value))
+            self.synth.queue_mod_wheel(float(value))
         elif param == "algorithm":
             # value is 1-based (1-32) from the GUI
             algo_0 = int(value) - 1
@@ -180,7 +196,7 @@ class VX7Controller:
         elif param.startswith("op") and param.endswith("_enable"):
             # e.g. "op1_enable" .. "op6_enable"
             op_num = int(param[2]) - 1  # 0-based
-            self.synth.set_operator_enabled(op_num, bool(value))
+            self.synth.queue_set_operator_enabled(op_num, bool(value))
         elif param == "init":
             self._init_voice()
 
@@ -190,13 +206,16 @@ class VX7Controller:
 
     def _load_preset(self, index: int) -> None:
         """Load a factory preset by index (0-31)."""
-        index = max(0, min(index, len(self._converted_presets) - 1))
+        index = max(0, min(index, len(self._patches) - 1))
         self._current_preset_index = index
-        preset = self._converted_presets[index]
-        self.synth.load_preset(preset)
+        patch = self._patches[index]
+        algo_0 = self._algorithms[index]
+        if algo_0 != patch.algorithm:
+            patch = dataclasses.replace(patch, algorithm=algo_0)
+        self.synth.queue_load_patch(patch)
 
-        name = preset["name"]
-        algo = preset["algorithm"] + 1  # show 1-based to user
+        name = self._preset_names[index]
+        algo = algo_0 + 1  # show 1-based to user
 
         # Update GUI.
         self.gui.update_preset(index, name)
@@ -204,25 +223,25 @@ class VX7Controller:
         self.gui.set_patch_number(index + 1)
         self.gui.update_display(
             f"{index + 1:2d} {name:<13s}",
-            f"ALGO {algo:2d}  FB {preset['feedback']}",
+            f"ALGO {algo:2d}  FB {patch.feedback}",
         )
 
     def _set_algorithm(self, algo_0based: int) -> None:
         """Set the algorithm (0-based) for the current preset."""
         algo_0based = algo_0based % 32
-        preset = self._converted_presets[self._current_preset_index]
-        preset["algorithm"] = algo_0based
-        self.synth.set_algorithm(algo_0based)
+        patch = self._patches[self._current_preset_index]
+        self._algorithms[self._current_preset_index] = algo_0based
+        self.synth.queue_set_algorithm(algo_0based)
         self.gui.update_algorithm(algo_0based + 1)
         self.gui.update_display_line2(
-            f"ALGO {algo_0based + 1:2d}  FB {preset['feedback']}"
+            f"ALGO {algo_0based + 1:2d}  FB {patch.feedback}"
         )
 
     def _init_voice(self) -> None:
         """Reset to the INIT VOICE preset."""
         from engine.voice import _default_preset
         init = _default_preset()
-        self.synth.load_preset(init)
+        self.synth.queue_load_preset(init)
         self.gui.update_algorithm(1)
         self.gui.update_display("INIT VOICE", "ALGO  1  FB 0")
 
@@ -234,6 +253,9 @@ class VX7Controller:
         """Start audio and run the GUI main loop (blocks until closed)."""
         try:
             self.audio.start()
+            # render() now runs on the audio thread and drains the synth's
+            # event queue; until then events were applied at once.
+            self.synth.realtime = True
             print("[VX7] Audio engine started")
             print(f"[VX7] Latency: {self.audio.latency_ms:.1f} ms")
         except RuntimeError as e:
@@ -250,6 +272,7 @@ class VX7Controller:
         print("[VX7] Shutting down...")
         self.synth.panic()
         self.audio.destroy()
+        self.synth.realtime = False
         self.midi.destroy()
         print("[VX7] Goodbye!")
 
@@ -5,8 +5,9 @@ application continues to work via the on-screen keyboard.  MIDI can be
 enabled and disabled at runtime without restarting the app.
 
 All public methods are safe to call from any thread.  Callbacks are invoked
-on the rtmidi listener thread -- callers that need to interact with the GUI
-or audio engine should use appropriate synchronisation.
+on the rtmidi listener thread, which reads them from an immutable snapshot
+without locking -- callers that need to interact with the GUI or audio
+engine should use appropriate synchronisation.
 """
 
 from __future__ import annotations
@@ -18,6 +19,33 @@ from typing import Callable, Optional
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------
+# Channel-message handlers
+# ----------------------------------------------------------------------
+# Each takes the message bytes (at least three) and the callback snapshot
+# ``(enabled, note_on_cb, note_off_cb, cc_cb)``.
+
+def _handle_note_on(message: list[int], snapshot: tuple) -> None:
+    note = message[1] & 0x7F
+    velocity = message[2] & 0x7F
+    if velocity == 0:
+        # Note On with velocity 0 is equivalent to Note Off.
+        if snapshot[2] is not None:
+            snapshot[2](note)
+    elif snapshot[1] is not None:
+        snapshot[1](note, velocity)
+
+
+def _handle_note_off(message: list[int], snapshot: tuple) -> None:
+    if snapshot[2] is not None:
+        snapshot[2](message[1] & 0x7F)
+
+
+def _handle_control_change(message: list[int], snapshot: tuple) -> None:
+    if snapshot[3] is not None:
+        snapshot[3](message[1] & 0x7F, message[2] & 0x7F)
+
+
 class MidiHandler:
     """Optional MIDI input handler using python-rtmidi.
 
@@ -30,6 +58,13 @@ class MidiHandler:
     _NOTE_ON = 0x90
     _CONTROL_CHANGE = 0xB0
 
+    # Handler for each status nibble we parse; anything else is ignored.
+    _DISPATCH = {
+        _NOTE_ON: _handle_note_on,
+        _NOTE_OFF: _handle_note_off,
+        _CONTROL_CHANGE: _handle_control_change,
+    }
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._enabled = False
@@ -39,8 +74,19 @@ class MidiHandler:
         self._note_on_cb: Optional[Callable[[int, int], None]] = None
         self._note_off_cb: Optional[Callable[[int], None]] = None
         self._cc_cb: Optional[Callable[[int, int], None]] = None
+        # (enabled, note_on_cb, note_off_cb, cc_cb) as read by the rtmidi
+        # thread.  It is rebuilt under the lock whenever any of them
+        # changes and replaced in a single assignment, so the listener can
+        # read it without taking the lock.
+        self._snapshot: tuple = (False, None, None, None)
         self._available = self._check_rtmidi()
 
+    def _publish_locked(self) -> None:
+        """Refresh the listener's snapshot -- must be called with *_lock* held."""
+        self._snapshot = (
+            self._enabled, self._note_on_cb, self._note_off_cb, self._cc_cb,
+        )
+
     # ------------------------------------------------------------------
     # Availability / state queries
     # ------------------------------------------------------------------
@@ -189,6 +235,7 @@ class MidiHandler:
             if not self._open_port_locked(port_index):
                 return False
             self._enabled = True
+            self._publish_locked()
             logger.info("MIDI enabled on port %d", port_index)
             return True
 
@@ -196,6 +243,7 @@ class MidiHandler:
         """Disable MIDI input and close the port."""
         with self._lock:
             self._enabled = False
+            self._publish_locked()
             self._close_port_locked()
             logger.info("MIDI disabled")
 
@@ -247,6 +295,7 @@ class MidiHandler:
             self._note_on_cb = note_on
             self._note_off_cb = note_off
             self._cc_cb = cc
+            self._publish_locked()
 
     # ------------------------------------------------------------------
     # Internal MIDI message parsing
@@ -273,40 +322,18 @@ class MidiHandler:
             if not message:
                 return
 
-            status = message[0]
-            msg_type = status & 0xF0  # strip channel nibble
-
-            # Grab a snapshot of the callbacks under the lock so that the
-            # actual invocations happen outside the lock (avoids potential
-            # deadlocks if a callback tries to call back into MidiHandler).
-            with self._lock:
-                if not self._enabled:
-                    return
-                note_on_cb = self._note_on_cb
-                note_off_cb = self._note_off_cb
-                cc_cb = self._cc_cb
-
-            if msg_type == self._NOTE_ON and len(message) >= 3:
-                note = message[1] & 0x7F
-                velocity = message[2] & 0x7F
-                if velocity == 0:
-                    # Note On with velocity 0 is equivalent to Note Off.
-                    if note_off_cb is not None:
-                        note_off_cb(note)
-                else:
-                    if note_on_cb is not None:
-                        note_on_cb(note, velocity)
-
-            elif msg_type == self._NOTE_OFF and len(message) >= 3:
-                note = message[1] & 0x7F
-                if note_off_cb is not None:
-                    note_off_cb(note)
-
-            elif msg_type == self._CONTROL_CHANGE and len(message) >= 3:
-                control = message[1] & 0x7F
-                value = message[2] & 0x7F
-                if cc_cb is not None:
-                    cc_cb(control, value)
+            # Read the published snapshot of the callbacks; no lock is
+            # taken per message, and the callbacks run outside the lock
+            # (a callback may safely call back into MidiHandler).
+            snapshot = self._snapshot
+            if not snapshot[0]:
+                return
+
+            # Dispatch on the status nibble (channel stripped); all parsed
+            # messages carry two data bytes.
+            handler = self._DISPATCH.get(message[0] & 0xF0)
+            if handler is not None and len(message) >= 3:
+                handler(message, snapshot)
 
         except Exception:
             # Never let an exception escape into the rtmidi thread.
@@ -327,5 +354,6 @@ class MidiHandler:
             self._note_on_cb = None
             self._note_off_cb = None
             self._cc_cb = None
+            self._publish_locked()
             self._close_port_locked()
             logger.info("MidiHandler destroyed")